@@ -135,7 +135,7 @@ with DAG(
     # Task 4: Clean old backups (keep last 30 days)
     cleanup_old_backups = BashOperator(
         task_id='cleanup_old_backups',
-        bash_command='find data/backups -name "*.csv" -mtime +30 -delete',
+        bash_command='find data/backups \\( -name "*.csv" -o -name "*.parquet" \\) -mtime +30 -delete',
     )
     
     # Task 5: Send success notification
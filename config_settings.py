@@ -17,6 +17,10 @@ YFINANCE_RATE_LIMIT_DELAY = 0.5  # Seconds between requests
 YFINANCE_BATCH_SIZE = 5  # Max tickers to fetch in one batch
 YFINANCE_CACHE_HOURS = 24  # Cache Yahoo Finance data for 24 hours
 
+# FRED rate limiting
+FRED_MAX_WORKERS = 10  # Concurrent FRED requests
+FRED_REQUESTS_PER_MINUTE = 120  # FRED API limit
+
 # Data sources
 DATA_SOURCES = {
     'fred': {
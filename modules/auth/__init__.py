@@ -1,4 +1,5 @@
 # Auth module for credentials management
 from .credentials_manager import CredentialsManager, get_credentials_manager
+from .setup import initialize
 
-__all__ = ['CredentialsManager', 'get_credentials_manager']
+__all__ = ['CredentialsManager', 'get_credentials_manager', 'initialize']
@@ -5,27 +5,59 @@ Provides encrypted storage and retrieval of sensitive credentials.
 
 import os
 import json
-from typing import Optional, Dict
+from typing import Optional, Dict, Any
 from cryptography.fernet import Fernet
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Dict[str, str]) -> bytes:
+    """Serialize credentials to JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _loads(data: bytes) -> Dict[str, str]:
+    """Deserialize credentials from JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode())
+
+
+class NullCipher:
+    """Pass-through cipher with Fernet's encrypt/decrypt interface (tests only)"""
+    
+    def encrypt(self, data: bytes) -> bytes:
+        return data
+    
+    def decrypt(self, data: bytes) -> bytes:
+        return data
+
 
 class CredentialsManager:
     """Manage API keys and credentials securely"""
     
-    def __init__(self, credentials_dir: str = 'data/credentials'):
+    def __init__(self, credentials_dir: str = 'data/credentials', cipher: Optional[Any] = None):
         """
         Initialize credentials manager.
         
         Args:
             credentials_dir: Directory to store encrypted credentials
+            cipher: Object with encrypt/decrypt methods; defaults to a Fernet
+                cipher keyed from the directory's key file
         """
         self.credentials_dir = Path(credentials_dir)
         self.credentials_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize or load encryption key
         self.key_file = self.credentials_dir / '.key'
-        self.cipher = self._init_encryption()
+        self.cipher = cipher if cipher is not None else self._init_encryption()
         
         # Credentials file
         self.creds_file = self.credentials_dir / 'credentials.enc'
@@ -55,7 +87,7 @@ class CredentialsManager:
                 encrypted_data = f.read()
             
             decrypted_data = self.cipher.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode())
+            return _loads(decrypted_data)
         except Exception as e:
             print(f"Warning: Could not load credentials: {e}")
             return {}
@@ -63,14 +95,17 @@ class CredentialsManager:
     def _save_credentials(self, credentials: Dict[str, str]):
         """Encrypt and save all credentials"""
         try:
-            json_data = json.dumps(credentials).encode()
+            json_data = _dumps(credentials)
             encrypted_data = self.cipher.encrypt(json_data)
             
-            with open(self.creds_file, 'wb') as f:
+            # Write to a temp file and swap it in so readers never see a partial file
+            tmp_file = self.creds_file.with_suffix('.enc.tmp')
+            with open(tmp_file, 'wb') as f:
                 f.write(encrypted_data)
             
             # Secure the credentials file
-            os.chmod(self.creds_file, 0o600)
+            os.chmod(tmp_file, 0o600)
+            os.replace(tmp_file, self.creds_file)
         except Exception as e:
             print(f"Error saving credentials: {e}")
     
@@ -82,8 +117,17 @@ class CredentialsManager:
             service: Name of the service (e.g., 'fred', 'yahoo_finance')
             api_key: The API key to store
         """
+        self.set_api_keys({service: api_key})
+    
+    def set_api_keys(self, api_keys: Dict[str, str]):
+        """
+        Store several API keys with a single read and write of the store.
+        
+        Args:
+            api_keys: Mapping of service name to API key
+        """
         credentials = self._load_credentials()
-        credentials[service] = api_key
+        credentials.update(api_keys)
         self._save_credentials(credentials)
     
     def get_api_key(self, service: str) -> Optional[str]:
@@ -0,0 +1,85 @@
+"""
+One-time API credentials setup.
+Stores the FRED API key in the encrypted credentials store and verifies it.
+"""
+
+import os
+from getpass import getpass
+
+from .credentials_manager import get_credentials_manager
+
+
+def initialize(interactive: bool = True) -> int:
+    """
+    Store the FRED API key securely and verify it can be read back.
+    
+    The key is taken from the FRED_API_KEY environment variable; if it is not
+    set and interactive is True, the user is prompted for it.
+    
+    Args:
+        interactive: Whether to prompt for the key when FRED_API_KEY is unset
+        
+    Returns:
+        Process exit code (0 on success, 1 on failure)
+    """
+    print("=" * 60)
+    print("🔐 Economic Dashboard - API Credentials Setup")
+    print("=" * 60)
+    
+    # Step 1: Initialize credentials
+    print("\n📝 Step 1: Setting up credentials manager...")
+    try:
+        creds_manager = get_credentials_manager()
+        print("✅ Credentials manager initialized")
+    except Exception as e:
+        print(f"❌ Error initializing credentials manager: {e}")
+        return 1
+    
+    # Step 2: Store FRED API key
+    print("\n🔑 Step 2: Storing FRED API key...")
+    fred_key = os.environ.get('FRED_API_KEY')
+    if not fred_key and interactive:
+        try:
+            fred_key = getpass('FRED API key: ')
+        except (EOFError, KeyboardInterrupt):
+            print("\n❌ No FRED API key entered; set FRED_API_KEY to run without a terminal")
+            return 1
+    if not fred_key:
+        print("❌ No FRED API key provided (set FRED_API_KEY or enter it at the prompt)")
+        return 1
+    
+    try:
+        creds_manager.set_api_key('fred', fred_key)
+        print("✅ FRED API key stored securely")
+    except Exception as e:
+        print(f"❌ Error storing API key: {e}")
+        return 1
+    
+    # Step 3: Verify storage
+    print("\n✓ Step 3: Verifying API key storage...")
+    try:
+        if creds_manager.get_api_key('fred') == fred_key:
+            print("✅ API key verified successfully")
+        else:
+            print("❌ API key verification failed")
+            return 1
+    except Exception as e:
+        print(f"❌ Error verifying API key: {e}")
+        return 1
+    
+    # Step 4: List configured services
+    print("\n📋 Step 4: Configured services:")
+    for service in creds_manager.list_services():
+        print(f"   ✓ {service.upper()}")
+    
+    # Summary
+    print("\n" + "=" * 60)
+    print("🎉 Setup Complete!")
+    print("=" * 60)
+    print("\n📊 Next steps:")
+    print("   1. Run the dashboard: streamlit run app.py")
+    print("   2. Visit the 'API Key Management' page to add more keys")
+    print("\n💡 Credentials are encrypted and stored in: data/credentials/")
+    print("   Never commit the credentials directory to git")
+    
+    return 0
@@ -195,13 +195,14 @@ def save_cboe_vix_to_duckdb(vix_df: Optional[pd.DataFrame] = None) -> dict:
         for col in ['open', 'high', 'low', 'close']:
             vix_clean[col] = pd.to_numeric(vix_clean[col], errors='coerce')
         
-        db.insert_df(vix_clean, 'cboe_vix_history', if_exists='append')
+        # Insert and refresh log entry commit together
+        with db.transaction():
+            db.insert_df(vix_clean, 'cboe_vix_history', if_exists='append')
+            log_data_refresh('cboe_vix_history', len(vix_clean), 'completed')
+        
         results['vix_records'] = len(vix_clean)
         print(f"Saved {len(vix_clean)} VIX records to DuckDB")
         
-        # Log successful refresh
-        log_data_refresh('cboe_vix_history', len(vix_clean), 'completed')
-        
     except Exception as e:
         print(f"Error saving VIX data to DuckDB: {e}")
         log_data_refresh('cboe_vix_history', 0, 'failed', str(e))
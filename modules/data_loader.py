@@ -265,10 +265,16 @@ def load_yfinance_data(tickers: dict, period: str = "5y") -> dict:
             
             if not db_data.empty:
                 # Convert to expected format (dict of DataFrames)
+                # Split once with groupby instead of a boolean mask scan per ticker;
+                # categorical codes make the grouping hash integers, not strings
+                db_data['ticker'] = db_data['ticker'].astype('category')
+                ticker_groups = dict(tuple(db_data.groupby('ticker', sort=False, observed=True)))
+                ticker_names = {v: k for k, v in tickers.items()}
+                
                 result = {}
                 for ticker in ticker_list:
-                    ticker_data = db_data[db_data['ticker'] == ticker].copy()
-                    if not ticker_data.empty:
+                    ticker_data = ticker_groups.get(ticker)
+                    if ticker_data is not None and not ticker_data.empty:
                         # Set date as index and select OHLCV columns
                         ticker_data = ticker_data.set_index('date')
                         ticker_data = ticker_data[['open', 'high', 'low', 'close', 'volume']]
@@ -276,7 +282,7 @@ def load_yfinance_data(tickers: dict, period: str = "5y") -> dict:
                             ticker_data['Adj Close'] = ticker_data['adj_close']
                         
                         # Find the descriptive name for this ticker
-                        name = next((k for k, v in tickers.items() if v == ticker), ticker)
+                        name = ticker_names.get(ticker, ticker)
                         result[name] = ticker_data
                 
                 if result:
@@ -3,7 +3,10 @@ Data series configuration with update frequencies and SLAs.
 Defines when each economic indicator should be refreshed based on its natural publication schedule.
 """
 
+import functools
 from datetime import timedelta
+from types import MappingProxyType
+from typing import Mapping
 
 # Update frequency definitions
 class UpdateFrequency:
@@ -129,32 +132,40 @@ YFINANCE_TICKERS_CONFIG = {
 }
 
 
-def get_all_fred_series() -> dict:
-    """Get all FRED series as a single dictionary."""
-    all_series = {}
-    for category_config in FRED_SERIES_CONFIG.values():
-        all_series.update(category_config['series'])
-    return all_series
+def _merge_category_maps(config: dict, key: str) -> dict:
+    """Merge the per-frequency name -> ID maps of a config into one dictionary."""
+    merged = {}
+    for category_config in config.values():
+        merged.update(category_config[key])
+    return merged
 
 
-def get_all_yfinance_tickers() -> dict:
-    """Get all Yahoo Finance tickers as a single dictionary."""
-    all_tickers = {}
-    for category_config in YFINANCE_TICKERS_CONFIG.values():
-        all_tickers.update(category_config['tickers'])
-    return all_tickers
+# The configs above are static, so the merged maps are built once at import
+_ALL_FRED_SERIES = _merge_category_maps(FRED_SERIES_CONFIG, 'series')
+_ALL_YFINANCE_TICKERS = _merge_category_maps(YFINANCE_TICKERS_CONFIG, 'tickers')
 
 
-def get_series_by_frequency(frequency: str, source: str = 'fred') -> dict:
-    """Get series that should be updated at the given frequency."""
+def get_all_fred_series() -> Mapping[str, str]:
+    """Get all FRED series as a single read-only mapping."""
+    return MappingProxyType(_ALL_FRED_SERIES)
+
+
+def get_all_yfinance_tickers() -> Mapping[str, str]:
+    """Get all Yahoo Finance tickers as a single read-only mapping."""
+    return MappingProxyType(_ALL_YFINANCE_TICKERS)
+
+
+@functools.cache
+def get_series_by_frequency(frequency: str, source: str = 'fred') -> Mapping[str, str]:
+    """Get series that should be updated at the given frequency (read-only, memoized)."""
     if source == 'fred':
         config = FRED_SERIES_CONFIG.get(frequency, {})
     elif source == 'yfinance':
         config = YFINANCE_TICKERS_CONFIG.get(frequency, {})
     else:
-        return {}
+        return MappingProxyType({})
     
-    return config.get('series' if source == 'fred' else 'tickers', {})
+    return MappingProxyType(config.get('series' if source == 'fred' else 'tickers', {}))
 
 
 def get_update_sla(frequency: str) -> timedelta:
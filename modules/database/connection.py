@@ -4,10 +4,12 @@ DuckDB Connection Manager
 Provides singleton connection management for the Economic Dashboard database.
 """
 
+import os
 import duckdb
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 import pandas as pd
+import pyarrow as pa
 from contextlib import contextmanager
 
 
@@ -16,6 +18,8 @@ class DatabaseConnection:
     
     _instance: Optional['DatabaseConnection'] = None
     _connection: Optional[duckdb.DuckDBPyConnection] = None
+    _in_transaction: bool = False
+    _db_path: Optional[Path] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -28,8 +32,10 @@ class DatabaseConnection:
     
     def _connect(self):
         """Establish connection to DuckDB database"""
-        db_path = Path(__file__).parent.parent.parent / 'data' / 'duckdb' / 'economic_dashboard.duckdb'
+        default_path = Path(__file__).parent.parent.parent / 'data' / 'duckdb' / 'economic_dashboard.duckdb'
+        db_path = Path(os.getenv('ECONOMIC_DASHBOARD_DB_PATH', default_path))
         db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_path = db_path
         
         # Create temp directory
         temp_dir = Path(__file__).parent.parent.parent / 'data' / 'duckdb' / 'temp'
@@ -52,6 +58,13 @@ class DatabaseConnection:
             self._connect()
         return self._connection
     
+    @property
+    def db_path(self) -> Path:
+        """Get the path of the database file this connection was opened on"""
+        if self._connection is None:
+            self._connect()
+        return self._db_path
+    
     def query(self, sql: str, params: Optional[tuple] = None) -> pd.DataFrame:
         """
         Execute a SELECT query and return results as DataFrame
@@ -79,37 +92,94 @@ class DatabaseConnection:
             self.connection.execute(sql, params)
         else:
             self.connection.execute(sql)
-        self.connection.commit()
+        
+        # Inside transaction() the commit happens once, when the block exits
+        if not self._in_transaction:
+            self.connection.commit()
     
-    def insert_df(self, df: pd.DataFrame, table_name: str, if_exists: str = 'append') -> None:
+    @contextmanager
+    def transaction(self):
         """
-        Insert a pandas DataFrame into a table
+        Group several statements into a single transaction
+        
+        execute() and insert_df() calls inside the block are committed together
+        on exit (one WAL flush) or rolled back if the block raises.
+        """
+        self.connection.begin()
+        self._in_transaction = True
+        try:
+            yield self
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+    
+    def insert_df(self, df: Union[pd.DataFrame, pa.Table], table_name: str,
+                  if_exists: str = 'append') -> int:
+        """
+        Insert a pandas DataFrame or Arrow table into a table
         
         Args:
-            df: DataFrame to insert
+            df: DataFrame or Arrow table to insert
             table_name: Name of the target table
             if_exists: What to do if table exists ('append', 'replace', 'fail')
+            
+        Returns:
+            Number of records inserted
         """
         # Register the DataFrame as a temporary view
         self.connection.register('temp_df', df)
         
-        if if_exists == 'replace':
-            self.execute(f"DELETE FROM {table_name}")
+        try:
+            if if_exists == 'replace':
+                self.execute(f"DELETE FROM {table_name}")
+            
+            # Get only the columns that exist in both the DataFrame and the table
+            # This avoids issues with auto-generated columns like created_at
+            column_names = df.column_names if isinstance(df, pa.Table) else df.columns
+            columns = ', '.join(column_names)
+            
+            # Insert from the temporary view, specifying only the columns we have
+            self.execute(f"INSERT INTO {table_name} ({columns}) SELECT {columns} FROM temp_df")
+        finally:
+            # Unregister the temporary view
+            self.connection.unregister('temp_df')
+        
+        return len(df)
+    
+    def upsert_df(self, df: pd.DataFrame, table_name: str,
+                  key_columns: Optional[List[str]] = None) -> None:
+        """
+        Insert or replace DataFrame rows, keyed on the table's primary key
+        
+        The DataFrame is registered with DuckDB and read in one bulk
+        INSERT OR REPLACE ... SELECT, rather than bound row by row.
         
-        # Get only the columns that exist in both the DataFrame and the table
-        # This avoids issues with auto-generated columns like created_at
-        columns = ', '.join(df.columns)
+        Args:
+            df: DataFrame whose columns match a subset of the table's columns
+            table_name: Name of the target table
+            key_columns: Primary key columns; when given, rows are sorted by them
+                first so index probes during the upsert are sequential
+        """
+        if key_columns and len(df) > 1:
+            df = df.sort_values(key_columns, kind='mergesort')
         
-        # Insert from the temporary view, specifying only the columns we have
-        self.execute(f"INSERT INTO {table_name} ({columns}) SELECT {columns} FROM temp_df")
+        self.connection.register('temp_upsert_df', df)
         
-        # Unregister the temporary view
-        self.connection.unregister('temp_df')
+        try:
+            columns = ', '.join(df.columns)
+            self.execute(
+                f"INSERT OR REPLACE INTO {table_name} ({columns}) SELECT {columns} FROM temp_upsert_df"
+            )
+        finally:
+            self.connection.unregister('temp_upsert_df')
     
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists in the database"""
         result = self.query(
-            "SELECT COUNT(*) as count FROM information_schema.tables WHERE table_name = ?",
+            "SELECT COUNT(*) as count FROM duckdb_tables() WHERE table_name = ?",
             (table_name,)
         )
         return result['count'].iloc[0] > 0
@@ -139,15 +209,15 @@ class DatabaseConnection:
             # Analyze all tables
             tables = self.query("""
                 SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'main'
+                FROM duckdb_tables() 
+                WHERE schema_name = 'main'
             """)
             for table in tables['table_name']:
                 self.execute(f"ANALYZE {table}")
     
     def get_database_size(self) -> dict:
         """Get database file size and table sizes"""
-        db_path = Path(__file__).parent.parent.parent / 'data' / 'duckdb' / 'economic_dashboard.duckdb'
+        db_path = self.db_path
         
         result = {
             'database_file_mb': db_path.stat().st_size / (1024 * 1024) if db_path.exists() else 0,
@@ -157,8 +227,8 @@ class DatabaseConnection:
         # Get table sizes
         tables = self.query("""
             SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'main'
+            FROM duckdb_tables()
+            WHERE schema_name = 'main'
             ORDER BY table_name
         """)
         
@@ -199,10 +269,5 @@ def init_database():
 @contextmanager
 def db_transaction():
     """Context manager for database transactions"""
-    conn = get_db_connection()
-    try:
+    with get_db_connection().transaction() as conn:
         yield conn
-        conn.connection.commit()
-    except Exception as e:
-        conn.connection.rollback()
-        raise e
@@ -677,6 +677,37 @@ def create_google_trends_table():
     db.execute("CREATE INDEX IF NOT EXISTS idx_trends_date ON google_trends(date)")
 
 
+def create_insider_transactions_table():
+    """Create table for SEC Form 4 insider transactions"""
+    db = get_db_connection()
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS insider_transactions (
+            ticker VARCHAR,
+            cik VARCHAR,
+            accession_number VARCHAR,
+            document VARCHAR,
+            transaction_date TIMESTAMP,
+            filing_date TIMESTAMP,
+            insider_name VARCHAR,
+            insider_title VARCHAR,
+            is_director BOOLEAN,
+            is_officer BOOLEAN,
+            transaction_code VARCHAR,
+            transaction_type VARCHAR,
+            shares DOUBLE,
+            price_per_share DOUBLE,
+            transaction_value DOUBLE,
+            acquired_disposed VARCHAR,
+            shares_owned_after DOUBLE,
+            security_type VARCHAR,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    db.execute("CREATE INDEX IF NOT EXISTS idx_insider_ticker ON insider_transactions(ticker)")
+    db.execute("CREATE INDEX IF NOT EXISTS idx_insider_date ON insider_transactions(transaction_date)")
+
+
 def create_all_tables():
     """Create all database tables"""
     print("Creating database schema...")
@@ -757,6 +788,9 @@ def create_all_tables():
     create_google_trends_table()
     print("✓ Created google_trends table")
     
+    create_insider_transactions_table()
+    print("✓ Created insider_transactions table")
+    
     print("\nDatabase schema created successfully!")
 
 
@@ -768,6 +802,7 @@ def drop_all_tables():
         'cboe_vix_history',
         'ici_etf_weekly_flows',
         'ici_etf_flows',
+        'insider_transactions',
         'google_trends',
         'sentiment_summary',
         'news_sentiment',
@@ -41,18 +41,17 @@ class DerivedFeaturesCalculator:
         Returns:
             DataFrame with Z-score columns
         """
-        z_scores = pd.DataFrame(index=df.index)
+        available = [feature for feature in features if feature in df.columns]
+        if not available:
+            return pd.DataFrame(index=df.index)
         
-        for feature in features:
-            if feature not in df.columns:
-                continue
-            
-            rolling_mean = df[feature].rolling(window=window).mean()
-            rolling_std = df[feature].rolling(window=window).std()
-            
-            # Avoid division by zero
-            z_score = (df[feature] - rolling_mean) / rolling_std.replace(0, np.nan)
-            z_scores[f'{feature}_zscore'] = z_score
+        # One rolling pass over all feature columns instead of one per feature
+        values = df[available]
+        rolling = values.rolling(window=window)
+        
+        # Avoid division by zero
+        z_scores = (values - rolling.mean()) / rolling.std().replace(0, np.nan)
+        z_scores.columns = [f'{feature}_zscore' for feature in available]
         
         return z_scores
     
@@ -599,14 +599,15 @@ class InsiderTradingTracker:
         signals = []
         signal_dates = []
         
+        # Locate each date's 90-day window as a row range of the sorted frame
+        all_dates = transactions_df['transaction_date'].to_numpy()
+        trans_dates = np.sort(pd.unique(all_dates))
+        window_starts = np.searchsorted(all_dates, trans_dates - np.timedelta64(90, 'D'), side='left')
+        window_ends = np.searchsorted(all_dates, trans_dates, side='right')
+        
         # Calculate sentiment for each transaction date
-        for trans_date in transactions_df['transaction_date'].unique():
-            # Get transactions up to this date (90-day window)
-            window_start = trans_date - timedelta(days=90)
-            window_df = transactions_df[
-                (transactions_df['transaction_date'] >= window_start) &
-                (transactions_df['transaction_date'] <= trans_date)
-            ]
+        for trans_date, start, end in zip(trans_dates, window_starts, window_ends):
+            window_df = transactions_df.iloc[start:end]
             
             sentiment = self.calculate_insider_sentiment(window_df, days=90)
             
@@ -752,15 +753,13 @@ class InsiderTradingTracker:
             return 0
         
         try:
+            from modules.database.schema import create_insider_transactions_table
+            
             db = get_db_connection()
             
-            # Ensure table exists (will be created by schema module)
-            transactions_df.to_sql(
-                'insider_transactions',
-                db.connection,
-                if_exists='append',
-                index=False
-            )
+            # Ensure table exists, then bulk insert via a registered DataFrame
+            create_insider_transactions_table()
+            db.insert_df(transactions_df, 'insider_transactions')
             
             return len(transactions_df)
         except Exception as e:
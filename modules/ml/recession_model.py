@@ -64,6 +64,8 @@ INDICATOR_WEIGHTS = {
     'market_signal': 0.05,           # Market sentiment
 }
 
+_FRED_INDICATOR_SERIES = {k: v for k, v in RECESSION_INDICATOR_SERIES.items() if v is not None}
+
 
 class RecessionProbabilityModel:
     """
@@ -639,4 +641,4 @@ def get_recession_indicator_series() -> Dict[str, str]:
     Returns:
         Dictionary mapping indicator names to FRED series IDs
     """
-    return {k: v for k, v in RECESSION_INDICATOR_SERIES.items() if v is not None}
+    return dict(_FRED_INDICATOR_SERIES)
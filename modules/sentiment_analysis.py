@@ -135,12 +135,11 @@ def analyze_news_sentiment(news_df: pd.DataFrame) -> pd.DataFrame:
     
     result_df = news_df.copy()
     
-    # Combine title and description for analysis
-    texts = []
-    for _, row in result_df.iterrows():
-        title = str(row.get('title', '')) if pd.notna(row.get('title')) else ''
-        desc = str(row.get('description', '')) if pd.notna(row.get('description')) else ''
-        texts.append(f"{title} {desc}".strip())
+    # Combine title and description for analysis (vectorized, no per-row iteration)
+    empty = pd.Series('', index=result_df.index)
+    titles = result_df.get('title', empty).fillna('').astype(str)
+    descs = result_df.get('description', empty).fillna('').astype(str)
+    texts = (titles + ' ' + descs).str.strip()
     
     # Analyze each text
     sentiments = [analyze_text_sentiment(text) for text in texts]
@@ -16,29 +16,50 @@ st.set_page_config(
 st.title("🔑 API Key Management")
 st.markdown("### Securely manage your API keys and credentials")
 
+
+@st.cache_resource
+def _creds():
+    """Credentials manager shared across reruns and sessions"""
+    return get_credentials_manager()
+
+
+@st.cache_data(ttl=60)
+def list_services_cached() -> list:
+    """Configured services, cached so reruns don't decrypt the credentials store"""
+    return _creds().list_services()
+
+
 # Initialize credentials manager
-creds_manager = get_credentials_manager()
+creds_manager = _creds()
+
+
+@st.fragment
+def configured_keys_section():
+    """Configured API keys listing; Remove clicks only rerun this fragment"""
+    configured_services = list_services_cached()
+    
+    if configured_services:
+        cols = st.columns(3)
+        
+        for idx, service in enumerate(configured_services):
+            with cols[idx % 3]:
+                st.success(f"✅ **{service.upper()}**")
+                st.caption(f"API key configured")
+                
+                if st.button(f"Remove", key=f"remove_{service}"):
+                    if creds_manager.delete_api_key(service):
+                        list_services_cached.clear()
+                        st.success(f"Removed {service} API key")
+                        st.rerun()
+    else:
+        st.info("ℹ️ No API keys configured yet. Add one below.")
+
 
 # Display current status
 st.divider()
 st.subheader("📋 Configured API Keys")
 
-configured_services = creds_manager.list_services()
-
-if configured_services:
-    cols = st.columns(3)
-    
-    for idx, service in enumerate(configured_services):
-        with cols[idx % 3]:
-            st.success(f"✅ **{service.upper()}**")
-            st.caption(f"API key configured")
-            
-            if st.button(f"Remove", key=f"remove_{service}"):
-                if creds_manager.delete_api_key(service):
-                    st.success(f"Removed {service} API key")
-                    st.rerun()
-else:
-    st.info("ℹ️ No API keys configured yet. Add one below.")
+configured_keys_section()
 
 # Add/Update API Keys
 st.divider()
@@ -82,6 +103,7 @@ with col2:
         if st.button("💾 Save API Key", use_container_width=True):
             if api_key_input:
                 creds_manager.set_api_key(service_key, api_key_input)
+                list_services_cached.clear()
                 st.success(f"✅ {selected_service} API key saved securely!")
                 st.rerun()
             else:
@@ -164,23 +186,29 @@ with col3:
     """)
 
 # Current FRED API Key Status
+@st.fragment
+def fred_status_section():
+    """FRED API key status; reads the cached service list instead of decrypting"""
+    if 'fred' in list_services_cached():
+        st.success("✅ FRED API key is configured and active")
+        st.info("Your dashboard is now using authenticated FRED API access for higher rate limits and reliability.")
+    else:
+        st.warning("⚠️ FRED API key not configured")
+        st.info("The dashboard will use unauthenticated access (limited rate limits)")
+        
+        if st.button("🚀 Quick Setup FRED Key"):
+            st.info("""
+            To set up your FRED API key:
+            1. Get your key from [FRED API Keys](https://fredaccount.stlouisfed.org/apikeys)
+            2. Use the form above to add it
+            3. Or run: `python setup_credentials.py`
+            """)
+
+
 st.divider()
 st.subheader("📊 FRED API Status")
 
-if creds_manager.has_api_key('fred'):
-    st.success("✅ FRED API key is configured and active")
-    st.info("Your dashboard is now using authenticated FRED API access for higher rate limits and reliability.")
-else:
-    st.warning("⚠️ FRED API key not configured")
-    st.info("The dashboard will use unauthenticated access (limited rate limits)")
-    
-    if st.button("🚀 Quick Setup FRED Key"):
-        st.info("""
-        To set up your FRED API key:
-        1. Get your key from [FRED API Keys](https://fredaccount.stlouisfed.org/apikeys)
-        2. Use the form above to add it
-        3. Or run: `python setup_credentials.py`
-        """)
+fred_status_section()
 
 # Sidebar information
 with st.sidebar:
@@ -2,15 +2,19 @@
 Database Compaction and Optimization Script
 
 This script:
-1. Runs VACUUM to reclaim space from deleted rows
+1. Runs VACUUM to reclaim space from deleted rows (skipped when nothing to reclaim)
 2. Rebuilds indexes with ANALYZE for better query performance
 3. Deduplicates records within retention windows
 4. Measures compression ratios and reports savings
 """
 
+import os
 import sys
+import json
 from pathlib import Path
 from datetime import datetime
+from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 
 # Add parent directory to path for imports
@@ -19,10 +23,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from modules.database import get_db_connection
 
 
+# One JSON object per compaction run, queryable with DuckDB's read_json_auto
+COMPACTION_LOG = Path(__file__).parent.parent / 'data' / 'duckdb' / 'compaction_log.ndjson'
+
+
 def get_database_metrics():
     """Get current database size and metrics."""
     db = get_db_connection()
-    db_path = Path(__file__).parent.parent / 'data' / 'duckdb' / 'economic_dashboard.duckdb'
+    db_path = db.db_path
     
     metrics = {
         'file_size_mb': db_path.stat().st_size / (1024 * 1024) if db_path.exists() else 0,
@@ -32,8 +40,8 @@ def get_database_metrics():
     # Get table row counts
     tables = db.query("""
         SELECT table_name
-        FROM information_schema.tables
-        WHERE table_schema = 'main'
+        FROM duckdb_tables()
+        WHERE schema_name = 'main'
         ORDER BY table_name
     """)
     
@@ -46,80 +54,121 @@ def get_database_metrics():
     return metrics
 
 
-def deduplicate_table(table_name: str, unique_columns: list) -> int:
+def configure_for_compaction(memory_limit: str = '8GB'):
     """
-    Remove duplicate records from a table.
+    Raise DuckDB resource limits for the compaction run.
+    
+    The connection defaults (4 threads, 2GB) suit the dashboard; VACUUM, ANALYZE
+    and the window-function dedup all parallelize and benefit from more headroom.
+    Insertion order is not needed when rebuilding tables, and dropping it lets
+    DuckDB skip order-preserving work.
     
     Args:
-        table_name: Name of table to deduplicate
-        unique_columns: Columns that define uniqueness
-        
-    Returns:
-        Number of duplicates removed
+        memory_limit: DuckDB memory limit (e.g. '8GB')
     """
     db = get_db_connection()
     
-    # Count duplicates
-    unique_cols_str = ', '.join(unique_columns)
-    
-    duplicate_query = f"""
-        SELECT COUNT(*) as dup_count
-        FROM (
-            SELECT {unique_cols_str}, COUNT(*) as cnt
-            FROM {table_name}
-            GROUP BY {unique_cols_str}
-            HAVING COUNT(*) > 1
-        )
+    db.execute(f"PRAGMA threads={os.cpu_count() or 4}")
+    db.execute(f"PRAGMA memory_limit='{memory_limit}'")
+    db.execute("PRAGMA preserve_insertion_order=false")
+
+
+def deduplicate_table(table_name: str, unique_columns: list) -> Tuple[int, List[str]]:
     """
+    Remove duplicate records from a table.
     
-    dup_result = db.query(duplicate_query)
-    dup_count = int(dup_result['dup_count'].iloc[0])
-    
-    if dup_count == 0:
-        return 0
-    
-    print(f"  Found {dup_count} duplicate groups in {table_name}")
+    Uses its own cursor so several tables can be deduplicated concurrently.
+    Progress messages are returned rather than printed, so concurrent runs
+    don't interleave their output.
     
-    # Create temp table with deduplicated data
-    # Keep the most recent record (based on created_at if available)
-    order_col = 'created_at DESC' if 'created_at' in db.query(f"DESCRIBE {table_name}")['column_name'].values else ''
+    Args:
+        table_name: Name of table to deduplicate
+        unique_columns: Columns that define uniqueness
+        
+    Returns:
+        Tuple of (number of duplicates removed, progress messages)
+    """
+    messages = []
+    cursor = get_db_connection().connection.cursor()
     
-    if order_col:
-        # Use ROW_NUMBER to keep most recent
-        dedup_query = f"""
-            CREATE TEMP TABLE {table_name}_dedup AS
-            SELECT * FROM (
-                SELECT *, 
-                       ROW_NUMBER() OVER (PARTITION BY {unique_cols_str} ORDER BY {order_col}) as rn
+    try:
+        unique_cols_str = ', '.join(unique_columns)
+        
+        # Count duplicate groups in one aggregation; the hash aggregate has to
+        # see every row either way, so this doubles as the "any duplicates?" check
+        duplicate_query = f"""
+            SELECT COUNT(*) as dup_count
+            FROM (
+                SELECT 1
                 FROM {table_name}
-            ) WHERE rn = 1
+                GROUP BY {unique_cols_str}
+                HAVING COUNT(*) > 1
+            )
         """
-    else:
-        # Just use DISTINCT
-        dedup_query = f"""
-            CREATE TEMP TABLE {table_name}_dedup AS
-            SELECT DISTINCT ON ({unique_cols_str}) *
-            FROM {table_name}
-        """
-    
-    db.execute(dedup_query)
-    
-    # Get count from dedup table
-    dedup_count = db.get_row_count(f"{table_name}_dedup")
-    records_removed = db.get_row_count(table_name) - dedup_count
-    
-    # Replace original table
-    db.execute(f"DELETE FROM {table_name}")
-    db.execute(f"INSERT INTO {table_name} SELECT * FROM {table_name}_dedup")
-    db.execute(f"DROP TABLE {table_name}_dedup")
-    
-    print(f"  ✓ Removed {records_removed} duplicate records from {table_name}")
-    
-    return records_removed
+        dup_count = int(cursor.execute(duplicate_query).fetchone()[0])
+        
+        if dup_count == 0:
+            return 0, messages
+        
+        messages.append(f"  Found {dup_count} duplicate groups in {table_name}")
+        
+        # Create temp table with deduplicated data
+        # Keep the most recent record (based on created_at if available)
+        columns = cursor.execute(f"DESCRIBE {table_name}").df()['column_name'].values
+        order_col = 'created_at DESC' if 'created_at' in columns else ''
+        
+        if order_col:
+            # Use ROW_NUMBER to keep most recent
+            dedup_query = f"""
+                CREATE TEMP TABLE {table_name}_dedup AS
+                SELECT * EXCLUDE (rn) FROM (
+                    SELECT *, 
+                           ROW_NUMBER() OVER (PARTITION BY {unique_cols_str} ORDER BY {order_col}) as rn
+                    FROM {table_name}
+                ) WHERE rn = 1
+            """
+        else:
+            # Just use DISTINCT
+            dedup_query = f"""
+                CREATE TEMP TABLE {table_name}_dedup AS
+                SELECT DISTINCT ON ({unique_cols_str}) *
+                FROM {table_name}
+            """
+        
+        cursor.execute(dedup_query)
+        
+        # Replace original table in one transaction so a failed INSERT can't
+        # leave it empty; DELETE and INSERT report their affected row counts,
+        # so no separate COUNT(*) queries are needed
+        cursor.begin()
+        try:
+            original_count = cursor.execute(f"DELETE FROM {table_name}").fetchone()[0]
+            dedup_count = cursor.execute(f"INSERT INTO {table_name} SELECT * FROM {table_name}_dedup").fetchone()[0]
+            cursor.commit()
+        except Exception:
+            cursor.rollback()
+            raise
+        finally:
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}_dedup")
+        records_removed = original_count - dedup_count
+    finally:
+        cursor.close()
+    
+    messages.append(f"  ✓ Removed {records_removed} duplicate records from {table_name}")
+    
+    return records_removed, messages
 
 
-def deduplicate_all_tables():
-    """Deduplicate all tables based on their primary keys."""
+def deduplicate_all_tables(max_workers: int = 4):
+    """
+    Deduplicate all tables based on their primary keys.
+    
+    Tables are processed concurrently; DuckDB serializes the writes, but the
+    scan and window phases of different tables overlap.
+    
+    Args:
+        max_workers: Maximum number of tables to deduplicate at once
+    """
     db = get_db_connection()
     
     # Define primary key columns for each table
@@ -146,27 +195,63 @@ def deduplicate_all_tables():
     print("DEDUPLICATING TABLES")
     print("=" * 70)
     
+    existing_tables = {
+        table_name: unique_cols
+        for table_name, unique_cols in table_unique_keys.items()
+        if db.table_exists(table_name)
+    }
+    
     total_removed = 0
     
-    for table_name, unique_cols in table_unique_keys.items():
-        if db.table_exists(table_name):
-            try:
-                removed = deduplicate_table(table_name, unique_cols)
-                total_removed += removed
-            except Exception as e:
-                print(f"  ⚠️  Error deduplicating {table_name}: {e}")
+    if existing_tables:
+        workers = min(max_workers, len(existing_tables))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(deduplicate_table, table_name, unique_cols): table_name
+                for table_name, unique_cols in existing_tables.items()
+            }
+            
+            for future in as_completed(futures):
+                table_name = futures[future]
+                try:
+                    records_removed, messages = future.result()
+                except Exception as e:
+                    print(f"  ⚠️  Error deduplicating {table_name}: {e}")
+                    continue
+                
+                # Print from the main thread so each table's lines stay together
+                for message in messages:
+                    print(message)
+                total_removed += records_removed
     
     print(f"\n✓ Total duplicates removed: {total_removed:,}")
     
     return total_removed
 
 
-def compact_database(analyze_tables: bool = True):
+def get_free_block_ratio() -> float:
+    """Get the fraction of allocated blocks that are free (reclaimable)."""
+    db = get_db_connection()
+    
+    size_info = db.query("PRAGMA database_size")
+    total_blocks = int(size_info['total_blocks'].iloc[0])
+    free_blocks = int(size_info['free_blocks'].iloc[0])
+    
+    return free_blocks / total_blocks if total_blocks > 0 else 0.0
+
+
+def compact_database(analyze_tables: bool = True, did_dedup: bool = False,
+                     free_block_threshold: float = 0.05):
     """
     Compact the database and rebuild indexes.
     
+    VACUUM only helps after deletes, so it is skipped on the append-only path
+    unless enough free blocks have accumulated to be worth reclaiming.
+    
     Args:
         analyze_tables: Whether to run ANALYZE on all tables
+        did_dedup: Whether deduplication removed any rows before compaction
+        free_block_threshold: Minimum free/total block ratio that triggers VACUUM
     """
     db = get_db_connection()
     
@@ -180,10 +265,14 @@ def compact_database(analyze_tables: bool = True):
     
     print(f"\nDatabase size before: {size_before:.2f} MB")
     
-    # Run VACUUM to reclaim space
-    print("\nRunning VACUUM...")
-    db.vacuum()
-    print("✓ VACUUM completed")
+    # Run VACUUM to reclaim space, but only when there is something to reclaim
+    free_ratio = get_free_block_ratio()
+    if did_dedup or free_ratio > free_block_threshold:
+        print(f"\nRunning VACUUM (free blocks: {free_ratio:.1%})...")
+        db.vacuum()
+        print("✓ VACUUM completed")
+    else:
+        print(f"\nSkipping VACUUM (free blocks: {free_ratio:.1%}, nothing to reclaim)")
     
     # Run CHECKPOINT to write everything to disk
     print("\nRunning CHECKPOINT...")
@@ -247,6 +336,23 @@ def generate_report():
     print("-" * 70)
     print(f"{'TOTAL':<40} {total_records:>15,}")
     print("=" * 70)
+    
+    if COMPACTION_LOG.exists():
+        history = db.query(f"""
+            SELECT timestamp, size_before_mb, size_after_mb, saved_mb, compression_ratio
+            FROM read_json_auto('{COMPACTION_LOG.as_posix()}')
+            ORDER BY timestamp DESC
+            LIMIT 30
+        """)
+        
+        print(f"\nRecent Compactions (last {len(history)}):")
+        print("-" * 70)
+        print(f"{'Timestamp':<22} {'Before MB':>11} {'After MB':>11} {'Saved MB':>11} {'Ratio':>8}")
+        print("-" * 70)
+        for _, run in history.iterrows():
+            print(f"{str(run['timestamp'])[:19]:<22} {run['size_before_mb']:>11.2f} "
+                  f"{run['size_after_mb']:>11.2f} {run['saved_mb']:>11.2f} {run['compression_ratio']:>7.2f}x")
+        print("=" * 70)
 
 
 def main():
@@ -260,6 +366,8 @@ def main():
                        help='Skip ANALYZE step (faster but less optimal queries)')
     parser.add_argument('--report-only', action='store_true',
                        help='Only generate report, do not compact')
+    parser.add_argument('--memory-limit', default='8GB',
+                       help='DuckDB memory limit during compaction (default: 8GB)')
     
     args = parser.parse_args()
     
@@ -267,27 +375,30 @@ def main():
         if args.report_only:
             generate_report()
         else:
+            configure_for_compaction(memory_limit=args.memory_limit)
+            
             # Deduplicate if requested
+            total_removed = 0
             if args.deduplicate:
-                deduplicate_all_tables()
+                total_removed = deduplicate_all_tables()
             
             # Compact database
-            results = compact_database(analyze_tables=not args.no_analyze)
+            results = compact_database(
+                analyze_tables=not args.no_analyze,
+                did_dedup=total_removed > 0
+            )
             
             # Generate final report
             generate_report()
             
             print("\n✅ Database compaction completed successfully")
             
-            # Log results
-            log_file = Path(__file__).parent.parent / 'data' / 'duckdb' / 'compaction_log.txt'
-            log_file.parent.mkdir(parents=True, exist_ok=True)
+            # Log results as one NDJSON line per run
+            COMPACTION_LOG.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(log_file, 'a') as f:
-                f.write(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"  Size: {results['size_before_mb']:.2f} MB → {results['size_after_mb']:.2f} MB\n")
-                f.write(f"  Saved: {results['saved_mb']:.2f} MB ({(results['saved_mb']/results['size_before_mb']*100):.1f}%)\n")
-                f.write(f"  Compression: {results['compression_ratio']:.2f}x\n")
+            with open(COMPACTION_LOG, 'a') as f:
+                json.dump({'timestamp': datetime.now().isoformat(), **results}, f)
+                f.write('\n')
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -30,8 +30,8 @@ def main():
         
         tables = db.query("""
             SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'main'
+            FROM duckdb_tables() 
+            WHERE schema_name = 'main'
             ORDER BY table_name
         """)
         
@@ -40,6 +40,11 @@ def main():
             count = db.get_row_count(table)
             print(f"  • {table}: {count} records")
         
+        # Refresh optimizer statistics so the first queries get real cardinality estimates
+        print("\nAnalyzing tables...")
+        db.execute("ANALYZE")
+        print("✓ ANALYZE completed")
+        
         print("\n" + "=" * 60)
         print("Database initialization completed successfully!")
         print("=" * 60)
@@ -9,6 +9,8 @@ import sys
 from pathlib import Path
 import pickle
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from datetime import datetime
 
 # Add parent directory to path for imports
@@ -17,6 +19,56 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from modules.database import get_db_connection, insert_fred_data, insert_stock_data
 
 
+# Canonical names for yfinance column variants (keys are lowercased)
+CANONICAL_COLUMNS = {
+    'adj close': 'adj_close',
+    'adjclose': 'adj_close',
+    'adjusted_close': 'adj_close',
+    'index': 'date',
+    'datetime': 'date',
+    'timestamp': 'date',
+}
+
+# Fixed Arrow schema for yfinance_ohlcv rows, so per-ticker tables always concatenate
+YFINANCE_SCHEMA = pa.schema([
+    ('ticker', pa.string()),
+    ('date', pa.timestamp('ns')),
+    ('open', pa.float64()),
+    ('high', pa.float64()),
+    ('low', pa.float64()),
+    ('close', pa.float64()),
+    ('volume', pa.int64()),
+    ('adj_close', pa.float64()),
+])
+
+
+def to_yfinance_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Coerce one ticker's OHLCV frame (as insert_stock_data does) and convert it
+    to an Arrow table with YFINANCE_SCHEMA.
+    
+    Missing optional columns are filled with nulls.
+    """
+    df = df.copy()
+    df['date'] = pd.to_datetime(df['date'])
+    if df['date'].dt.tz is not None:
+        # Keep the exchange-local trading date; the target column is a DATE
+        df['date'] = df['date'].dt.tz_localize(None)
+    
+    for col in ['open', 'high', 'low', 'close', 'adj_close']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        else:
+            df[col] = float('nan')
+    
+    if 'volume' in df.columns:
+        df['volume'] = pd.to_numeric(df['volume'], errors='coerce').fillna(0).astype('int64')
+    else:
+        df['volume'] = pd.array([None] * len(df), dtype='Int64')
+    
+    return pa.Table.from_pandas(df[YFINANCE_SCHEMA.names], schema=YFINANCE_SCHEMA, preserve_index=False)
+
+
 def load_pickle_file(file_path: Path):
     """Load a pickle file safely"""
     try:
@@ -56,6 +108,18 @@ def migrate_fred_data():
     else:
         fred_data = cached_data
     
+    if isinstance(fred_data, dict):
+        print(f"Found {len(fred_data)} FRED series in dict format")
+        
+        # Align all series into one wide frame so the reshape below runs once
+        # over all of them instead of per series
+        fred_data = pd.DataFrame({
+            series_id: series_data.iloc[:, 0] if isinstance(series_data, pd.DataFrame) else series_data
+            for series_id, series_data in fred_data.items()
+            if isinstance(series_data, pd.Series)
+            or (isinstance(series_data, pd.DataFrame) and len(series_data.columns) > 0)
+        })
+    
     if isinstance(fred_data, pd.DataFrame):
         print(f"Found FRED DataFrame with shape {fred_data.shape}")
         print(f"Columns: {fred_data.columns.tolist()}")
@@ -94,37 +158,6 @@ def migrate_fred_data():
             print(f"✓ Inserted {records_inserted} FRED records")
             return records_inserted
     
-    elif isinstance(fred_data, dict):
-        print(f"Found {len(fred_data)} FRED series in dict format")
-        
-        # Convert dict to long format DataFrame
-        all_records = []
-        
-        for series_id, series_data in fred_data.items():
-            if isinstance(series_data, pd.Series):
-                df = series_data.reset_index()
-                df.columns = ['date', 'value']
-                df['series_id'] = series_id
-                all_records.append(df)
-            elif isinstance(series_data, pd.DataFrame):
-                # Assume first column is date, second is value
-                df = series_data.reset_index()
-                if len(df.columns) >= 2:
-                    df = df.iloc[:, :2]
-                    df.columns = ['date', 'value']
-                    df['series_id'] = series_id
-                    all_records.append(df)
-        
-        if all_records:
-            combined_df = pd.concat(all_records, ignore_index=True)
-            combined_df = combined_df[['series_id', 'date', 'value']]
-            combined_df = combined_df.dropna(subset=['value'])
-            
-            print(f"Inserting {len(combined_df)} FRED records...")
-            records_inserted = insert_fred_data(combined_df)
-            print(f"✓ Inserted {records_inserted} FRED records")
-            return records_inserted
-    
     return 0
 
 
@@ -171,12 +204,11 @@ def migrate_yfinance_data():
                 # Reset index to get date column
                 df = df.reset_index()
                 
-                # Standardize column names
-                df.columns = df.columns.str.lower()
-                
-                # Rename date column variants
-                date_col_mapping = {'index': 'date', 'datetime': 'date', 'timestamp': 'date'}
-                df.rename(columns=date_col_mapping, inplace=True)
+                # Standardize column names (lowercase + date/adj_close variants) in one pass
+                df.columns = [
+                    CANONICAL_COLUMNS.get(str(col).lower(), str(col).lower())
+                    for col in df.columns
+                ]
                 
                 # Ensure we have a date column
                 if 'date' not in df.columns and len(df.columns) > 0:
@@ -188,37 +220,26 @@ def migrate_yfinance_data():
                 # Add ticker column
                 df['ticker'] = ticker
                 
-                # Map common column name variations
-                column_mapping = {
-                    'adj close': 'adj_close',
-                    'adjclose': 'adj_close',
-                    'adjusted_close': 'adj_close',
-                    'adj_close': 'adj_close'
-                }
-                df.rename(columns=column_mapping, inplace=True)
-                
-                # Select required columns (in order expected by database)
-                required_cols = ['ticker', 'date', 'open', 'high', 'low', 'close', 'volume']
-                available_cols = [col for col in required_cols if col in df.columns]
-                
-                # Add adj_close if available
-                if 'adj_close' in df.columns:
-                    available_cols.append('adj_close')
-                
-                if 'date' in available_cols and 'ticker' in available_cols:
-                    all_records.append(df[available_cols])
+                if 'date' in df.columns:
+                    all_records.append(to_yfinance_table(df))
                 else:
                     print(f"⚠️  Skipping {ticker} - missing required columns")
                     print(f"   Available: {df.columns.tolist()}")
         
         if all_records:
-            combined_df = pd.concat(all_records, ignore_index=True)
+            # Arrow concatenation reuses the per-ticker column buffers instead of
+            # copying them into one contiguous pandas block
+            combined = pa.concat_tables(all_records)
             
             # Drop rows with missing required values
-            combined_df = combined_df.dropna(subset=['date', 'close'])
+            combined = combined.filter(
+                pc.and_(pc.is_valid(combined['date']), pc.is_valid(combined['close']))
+            )
             
-            print(f"Inserting {len(combined_df)} yfinance records for {combined_df['ticker'].nunique()} tickers...")
-            records_inserted = insert_stock_data(combined_df)
+            num_tickers = pc.count_distinct(combined['ticker']).as_py()
+            print(f"Inserting {combined.num_rows} yfinance records for {num_tickers} tickers...")
+            # to_yfinance_table already applied insert_stock_data's coercions
+            records_inserted = get_db_connection().insert_df(combined, 'yfinance_ohlcv')
             print(f"✓ Inserted {records_inserted} yfinance records")
             return records_inserted
     
@@ -289,6 +310,11 @@ def main():
         # Migrate yfinance data
         yf_records = migrate_yfinance_data()
         
+        # Refresh optimizer statistics after the bulk load
+        print("\nAnalyzing tables...")
+        get_db_connection().execute("ANALYZE")
+        print("✓ ANALYZE completed")
+        
         # Verify migration
         total_records = verify_migration()
         
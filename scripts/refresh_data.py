@@ -9,14 +9,22 @@ from pathlib import Path
 from datetime import datetime
 import pandas as pd
 import pickle
+import re
 import time
+import threading
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+from requests.adapters import HTTPAdapter
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pandas_datareader import data as pdr
 import yfinance as yf
-from config_settings import ensure_cache_dir, get_cache_dir
+from config_settings import (
+    ensure_cache_dir, get_cache_dir, FRED_MAX_WORKERS, FRED_REQUESTS_PER_MINUTE
+)
 
 
 # All FRED series used across the dashboard
@@ -73,6 +81,8 @@ FRED_SERIES = {
     'Prime Rate': 'DPRIME',
 }
 
+FRED_API_URL = 'https://api.stlouisfed.org/fred'
+
 # Yahoo Finance tickers
 YFINANCE_TICKERS = {
     'S&P 500': '^GSPC',
@@ -83,38 +93,247 @@ YFINANCE_TICKERS = {
 }
 
 
-def fetch_fred_data(series_dict: dict, years_back: int = 20) -> pd.DataFrame:
-    """Fetch all FRED data series."""
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly to stay under a per-minute budget."""
+    
+    def __init__(self, calls_per_minute: int):
+        self.interval = 60.0 / calls_per_minute
+        self._lock = threading.Lock()
+        self._next_call = time.monotonic()
+    
+    def wait(self):
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+_fred_session = None
+_fred_session_lock = threading.Lock()
+
+
+def get_fred_session() -> requests.Session:
+    """Get the shared keep-alive session used for FRED API requests."""
+    global _fred_session
+    with _fred_session_lock:
+        if _fred_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+            session.mount('https://', adapter)
+            _fred_session = session
+    return _fred_session
+
+
+def _describe_fred_error(error: Exception) -> str:
+    """
+    Describe a failed FRED request without leaking the API key.
+    
+    requests includes the full URL, api_key query parameter and all, in its
+    error messages, so HTTP errors are reduced to their status code and the
+    key is masked in anything else.
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"HTTP {error.response.status_code}"
+    return re.sub(r'api_key=[^&\s]+', 'api_key=***', str(error))
+
+
+def _fetch_fred_series(series_id: str, start_date, rate_limiter: RateLimiter,
+                       api_key: Optional[str] = None) -> pd.Series:
+    """
+    Fetch a single FRED series, respecting the shared rate limit.
+    
+    With an API key the JSON observations endpoint is called over the shared
+    session; otherwise falls back to pandas_datareader.
+    """
+    rate_limiter.wait()
+    if not api_key:
+        df = pdr.DataReader(series_id, 'fred', start=start_date)
+        return df[series_id]
+    
+    response = get_fred_session().get(
+        f"{FRED_API_URL}/series/observations",
+        params={
+            'series_id': series_id,
+            'api_key': api_key,
+            'file_type': 'json',
+            'observation_start': start_date.strftime('%Y-%m-%d'),
+        },
+        timeout=30
+    )
+    response.raise_for_status()
+    observations = pd.DataFrame.from_records(
+        response.json()['observations'], columns=['date', 'value']
+    )
+    # FRED reports missing observations as '.'
+    values = pd.to_numeric(observations['value'], errors='coerce')
+    return pd.Series(
+        values.to_numpy(),
+        index=pd.DatetimeIndex(pd.to_datetime(observations['date']), name='DATE'),
+        name=series_id
+    )
+
+
+def fetch_fred_data(series_dict: dict, years_back: int = 20,
+                    max_workers: int = FRED_MAX_WORKERS) -> pd.DataFrame:
+    """
+    Fetch all FRED data series.
+    
+    Requests are issued concurrently so network latency overlaps, while a
+    shared rate limiter keeps the total under FRED's ~120 calls/min. With an
+    API key, series come from the JSON API over one keep-alive session.
+    """
     print(f"Fetching {len(series_dict)} FRED series...")
     
     start_date = datetime.now() - pd.DateOffset(years=years_back)
-    all_data = {}
+    rate_limiter = RateLimiter(FRED_REQUESTS_PER_MINUTE)
+    api_key = get_fred_api_key()
+    fetched = {}
     
-    for i, (name, series_id) in enumerate(series_dict.items(), 1):
-        try:
-            print(f"  Fetching {name} ({series_id})...", end=' ')
-            df = pdr.DataReader(series_id, 'fred', start=start_date)
-            all_data[name] = df[series_id]
-            print("✓")
-            
-            # Add small delay to avoid rate limiting (FRED allows ~120 calls/min)
-            if i % 20 == 0:  # Pause every 20 requests
-                time.sleep(1)
-                
-        except Exception as e:
-            print(f"✗ Error: {e}")
-            continue
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_fred_series, series_id, start_date, rate_limiter, api_key): (name, series_id)
+            for name, series_id in series_dict.items()
+        }
+        
+        for future in as_completed(futures):
+            name, series_id = futures[future]
+            try:
+                fetched[name] = future.result()
+                print(f"  Fetched {name} ({series_id}) ✓")
+            except Exception as e:
+                print(f"  Fetching {name} ({series_id}) ✗ Error: {_describe_fred_error(e)}")
     
-    if not all_data:
+    if not fetched:
         raise ValueError("No FRED data was successfully fetched")
     
-    # Combine all series into single DataFrame
+    # Combine all series into single DataFrame, keeping the configured order
+    all_data = {name: fetched[name] for name in series_dict if name in fetched}
     combined_df = pd.DataFrame(all_data)
     print(f"Successfully fetched {len(all_data)} series with {len(combined_df)} rows")
     
     return combined_df
 
 
+def get_fred_api_key() -> Optional[str]:
+    """Get the FRED API key from the environment or the credentials manager."""
+    api_key = os.environ.get('FRED_API_KEY')
+    if api_key:
+        return api_key
+    
+    try:
+        from modules.auth.credentials_manager import get_credentials_manager
+        return get_credentials_manager().get_api_key('fred')
+    except Exception:
+        return None
+
+
+def _fetch_fred_last_updated(series_id: str, api_key: str, rate_limiter: RateLimiter) -> str:
+    """Fetch the 'last_updated' stamp of a FRED series from the series endpoint."""
+    rate_limiter.wait()
+    response = get_fred_session().get(
+        f"{FRED_API_URL}/series",
+        params={'series_id': series_id, 'api_key': api_key, 'file_type': 'json'},
+        timeout=30
+    )
+    response.raise_for_status()
+    return response.json()['seriess'][0]['last_updated']
+
+
+def fetch_fred_last_updated(series_dict: dict, api_key: str,
+                            max_workers: int = FRED_MAX_WORKERS) -> dict:
+    """
+    Fetch FRED 'last_updated' stamps for all series.
+    
+    Returns:
+        Dictionary of series_id -> last_updated; series whose lookup failed are omitted
+    """
+    series_ids = set(series_dict.values())
+    rate_limiter = RateLimiter(FRED_REQUESTS_PER_MINUTE)
+    last_updated = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_fred_last_updated, series_id, api_key, rate_limiter): series_id
+            for series_id in series_ids
+        }
+        
+        for future in as_completed(futures):
+            try:
+                last_updated[futures[future]] = future.result()
+            except Exception as e:
+                print(f"  Could not check {futures[future]} for updates: {_describe_fred_error(e)}")
+    
+    return last_updated
+
+
+def refresh_fred_data(series_dict: dict, previous_cache: Optional[dict] = None,
+                      years_back: int = 20) -> tuple:
+    """
+    Refresh FRED data, re-fetching only series FRED has updated since the last run.
+    
+    Each series' 'last_updated' stamp is compared with the one stored in the
+    previous cache; unchanged series are reused from that cache. Without an API
+    key (required by the series endpoint) or a previous cache, everything is fetched.
+    
+    Args:
+        series_dict: Dictionary of descriptive name -> FRED series ID
+        previous_cache: Previous cache contents ('data' and 'series_last_updated')
+        years_back: How many years of history to fetch for updated series
+        
+    Returns:
+        Tuple of (combined DataFrame, series_id -> last_updated for cached series)
+    """
+    api_key = get_fred_api_key()
+    if not api_key:
+        print("No FRED API key configured; fetching all series")
+        return fetch_fred_data(series_dict, years_back=years_back), {}
+    
+    previous_cache = previous_cache or {}
+    previous_data = previous_cache.get('data')
+    if not isinstance(previous_data, pd.DataFrame):
+        previous_data = pd.DataFrame()
+    previous_updated = previous_cache.get('series_last_updated', {})
+    
+    print(f"Checking {len(series_dict)} FRED series for updates...")
+    current_updated = fetch_fred_last_updated(series_dict, api_key)
+    
+    unchanged = {
+        name: series_id for name, series_id in series_dict.items()
+        if name in previous_data.columns
+        and series_id in current_updated
+        and previous_updated.get(series_id) == current_updated[series_id]
+    }
+    stale = {name: series_id for name, series_id in series_dict.items() if name not in unchanged}
+    print(f"  {len(unchanged)} series unchanged since last refresh, {len(stale)} to fetch")
+    
+    fetched = pd.DataFrame()
+    if stale:
+        try:
+            fetched = fetch_fred_data(stale, years_back=years_back)
+        except ValueError:
+            if previous_data.empty:
+                raise
+            print("  ⚠️  No updated series could be fetched; keeping previous data")
+    
+    all_data = {}
+    series_last_updated = {}
+    for name, series_id in series_dict.items():
+        if name in fetched.columns:
+            all_data[name] = fetched[name]
+            if series_id in current_updated:
+                series_last_updated[series_id] = current_updated[series_id]
+        elif name in previous_data.columns:
+            # Unchanged, or the fetch failed and the previous data is the best we have
+            all_data[name] = previous_data[name]
+            if name in unchanged:
+                series_last_updated[series_id] = current_updated[series_id]
+    
+    return pd.DataFrame(all_data), series_last_updated
+
+
 def fetch_yfinance_data(tickers_dict: dict, years_back: int = 10, max_retries: int = 3) -> dict:
     """Fetch Yahoo Finance data for market indicators with retry logic."""
     print(f"\nFetching {len(tickers_dict)} Yahoo Finance tickers...")
@@ -162,14 +381,29 @@ def fetch_yfinance_data(tickers_dict: dict, years_back: int = 10, max_retries: i
     return all_data
 
 
-def save_to_cache(data, cache_filename: str):
-    """Save data to pickle cache with timestamp."""
+def load_cache(cache_filename: str) -> Optional[dict]:
+    """Load the full pickle cache dict (timestamp, data, metadata), if present."""
+    cache_file = os.path.join(get_cache_dir(), cache_filename)
+    if not os.path.exists(cache_file):
+        return None
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        print(f"Could not load {cache_file}: {e}")
+        return None
+
+
+def save_to_cache(data, cache_filename: str, **metadata):
+    """Save data to pickle cache with timestamp and optional metadata."""
     ensure_cache_dir()
     cache_file = os.path.join(get_cache_dir(), cache_filename)
     
     cache_data = {
         'timestamp': datetime.now(),
-        'data': data
+        'data': data,
+        **metadata
     }
     
     with open(cache_file, 'wb') as f:
@@ -178,23 +412,23 @@ def save_to_cache(data, cache_filename: str):
     print(f"Saved to {cache_file}")
 
 
-def save_to_csv_backup(data, csv_filename: str):
-    """Save data to CSV for backup and inspection."""
+def save_to_parquet_backup(data, backup_filename: str):
+    """Save data to zstd-compressed Parquet for backup and inspection."""
     backup_dir = 'data/backups'
     os.makedirs(backup_dir, exist_ok=True)
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    csv_file = os.path.join(backup_dir, f"{timestamp}_{csv_filename}")
+    backup_file = os.path.join(backup_dir, f"{timestamp}_{backup_filename}")
     
     if isinstance(data, pd.DataFrame):
-        data.to_csv(csv_file)
+        data.to_parquet(backup_file, engine='pyarrow', compression='zstd')
     elif isinstance(data, dict):
         # For Yahoo Finance data, save each ticker separately
         for name, df in data.items():
-            ticker_file = csv_file.replace('.csv', f'_{name}.csv')
-            df.to_csv(ticker_file)
+            ticker_file = backup_file.replace('.parquet', f'_{name}.parquet')
+            df.to_parquet(ticker_file, engine='pyarrow', compression='zstd')
     
-    print(f"Backup saved to {csv_file}")
+    print(f"Backup saved to {backup_file}")
 
 
 def main():
@@ -206,14 +440,16 @@ def main():
     
     try:
         # Fetch FRED data
-        fred_data = fetch_fred_data(FRED_SERIES, years_back=20)
-        save_to_cache(fred_data, 'fred_all_series.pkl')
-        save_to_csv_backup(fred_data, 'fred_data.csv')
+        fred_data, series_last_updated = refresh_fred_data(
+            FRED_SERIES, load_cache('fred_all_series.pkl'), years_back=20
+        )
+        save_to_cache(fred_data, 'fred_all_series.pkl', series_last_updated=series_last_updated)
+        save_to_parquet_backup(fred_data, 'fred_data.parquet')
         
         # Fetch Yahoo Finance data
         yf_data = fetch_yfinance_data(YFINANCE_TICKERS, years_back=10)
         save_to_cache(yf_data, 'yfinance_all_tickers.pkl')
-        save_to_csv_backup(yf_data, 'yfinance_data.csv')
+        save_to_parquet_backup(yf_data, 'yfinance_data.parquet')
         
         # Create summary report
         print("\n" + "=" * 60)
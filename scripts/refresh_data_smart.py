@@ -248,23 +248,23 @@ def save_combined_cache(data, filename: str):
     print(f"  💾 Saved combined cache to {cache_file}")
 
 
-def save_to_csv_backup(data, csv_filename: str):
-    """Save data to CSV for backup and inspection."""
+def save_to_parquet_backup(data, backup_filename: str):
+    """Save data to zstd-compressed Parquet for backup and inspection."""
     backup_dir = 'data/backups'
     os.makedirs(backup_dir, exist_ok=True)
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    csv_file = os.path.join(backup_dir, f"{timestamp}_{csv_filename}")
+    backup_file = os.path.join(backup_dir, f"{timestamp}_{backup_filename}")
     
     if isinstance(data, pd.DataFrame):
-        data.to_csv(csv_file)
-        print(f"  📄 Backup saved to {csv_file}")
+        data.to_parquet(backup_file, engine='pyarrow', compression='zstd')
+        print(f"  📄 Backup saved to {backup_file}")
     elif isinstance(data, dict):
         # For Yahoo Finance data, save each ticker separately
         for name, df in data.items():
-            ticker_file = csv_file.replace('.csv', f'_{name}.csv')
-            df.to_csv(ticker_file)
-        print(f"  📄 Backup saved to {csv_file.replace('.csv', '_*.csv')}")
+            ticker_file = backup_file.replace('.parquet', f'_{name}.parquet')
+            df.to_parquet(ticker_file, engine='pyarrow', compression='zstd')
+        print(f"  📄 Backup saved to {backup_file.replace('.parquet', '_*.parquet')}")
 
 
 def main():
@@ -308,12 +308,12 @@ def main():
         combined_fred = merge_all_caches('fred')
         if not combined_fred.empty:
             save_combined_cache(combined_fred, 'fred_all_series.pkl')
-            save_to_csv_backup(combined_fred, 'fred_data.csv')
+            save_to_parquet_backup(combined_fred, 'fred_data.parquet')
         
         combined_yf = merge_all_caches('yfinance')
         if combined_yf:
             save_combined_cache(combined_yf, 'yfinance_all_tickers.pkl')
-            save_to_csv_backup(combined_yf, 'yfinance_data.csv')
+            save_to_parquet_backup(combined_yf, 'yfinance_data.parquet')
         
         # Create summary report
         print("\n" + "=" * 70)
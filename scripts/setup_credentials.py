@@ -4,37 +4,19 @@ Run this script once to set up your API keys securely.
 """
 
 import sys
-import os
+import argparse
+from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from modules.auth.credentials_manager import get_credentials_manager
-
-
-def initialize_credentials():
-    """Initialize API credentials"""
-    print("🔐 API Credentials Setup")
-    print("=" * 50)
-    
-    creds_manager = get_credentials_manager()
-    
-    # FRED API Key
-    print("\nSetting up FRED API key...")
-    fred_key = "b077ecbf05fa5f0a6407b38e22552c4e"
-    creds_manager.set_api_key('fred', fred_key)
-    print("✅ FRED API key stored securely")
-    
-    # Display stored services
-    print("\n📋 Configured API Keys:")
-    for service in creds_manager.list_services():
-        print(f"  ✓ {service}")
-    
-    print("\n" + "=" * 50)
-    print("✅ Credentials initialized successfully!")
-    print("\nYou can now use the dashboard with authenticated API access.")
-    print("Credentials are encrypted and stored in: data/credentials/")
+from modules.auth.setup import initialize
 
 
 if __name__ == "__main__":
-    initialize_credentials()
+    parser = argparse.ArgumentParser(description='Store the FRED API key securely')
+    parser.add_argument('--non-interactive', action='store_true',
+                       help='Read the key only from FRED_API_KEY; never prompt')
+    args = parser.parse_args()
+    
+    sys.exit(initialize(interactive=not args.non_interactive))
@@ -6,219 +6,263 @@ Run this to verify the implementation is working correctly
 
 import sys
 import os
+import io
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
 # Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
+CHECK_TITLES = {
+    1: "Testing module imports...",
+    2: "Testing credentials manager initialization...",
+    3: "Testing API key storage...",
+    4: "Checking FRED API key...",
+    5: "Testing data loader integration...",
+    6: "Verifying file structure...",
+    7: "Testing encryption...",
+    8: "Checking configuration...",
+}
 
-def verify_implementation():
-    """Verify all components of the API key management feature"""
-    
-    print("=" * 70)
-    print("🔍 API KEY MANAGEMENT FEATURE VERIFICATION")
-    print("=" * 70)
-    
-    results = []
-    
-    # Test 1: Module imports
-    print("\n[1/8] Testing module imports...")
+
+def check_imports():
+    """Test 1: Module imports"""
     try:
         from modules.auth.credentials_manager import CredentialsManager, get_credentials_manager
         from modules.auth import CredentialsManager as CM
-        print("✅ All modules import successfully")
-        results.append(True)
+        return [(1, True, ["✅ All modules import successfully"])]
     except Exception as e:
-        print(f"❌ Import failed: {e}")
-        results.append(False)
-    
+        return [(1, False, [f"❌ Import failed: {e}"])]
+
+
+def check_credentials():
+    """
+    Tests 2, 3, 4 and 7: everything that touches the credentials manager.
+
+    These share (and mutate) the singleton manager, so they run in order
+    within a single task.
+    """
     # Test 2: Credentials manager initialization
-    print("\n[2/8] Testing credentials manager initialization...")
     try:
+        from modules.auth.credentials_manager import get_credentials_manager
         creds = get_credentials_manager()
         assert creds is not None
         assert creds.credentials_dir.exists()
         assert creds.key_file.exists()
-        print("✅ Credentials manager initialized")
-        print(f"   Directory: {creds.credentials_dir}")
-        print(f"   Key file: {creds.key_file}")
-        results.append(True)
+        results = [(2, True, [
+            "✅ Credentials manager initialized",
+            f"   Directory: {creds.credentials_dir}",
+            f"   Key file: {creds.key_file}",
+        ])]
     except Exception as e:
-        print(f"❌ Initialization failed: {e}")
-        results.append(False)
-        return results
-    
+        skipped = ["⚠️  Skipped: credentials manager unavailable"]
+        return [(2, False, [f"❌ Initialization failed: {e}"])] + [
+            (idx, False, skipped) for idx in (3, 4, 7)
+        ]
+
     # Test 3: API key storage
-    print("\n[3/8] Testing API key storage...")
     try:
         test_key = "test_verification_key_12345"
         creds.set_api_key('test_service', test_key)
         retrieved = creds.get_api_key('test_service')
         assert retrieved == test_key
-        print("✅ API key storage working")
-        print(f"   Stored and retrieved key successfully")
-        results.append(True)
+        results.append((3, True, [
+            "✅ API key storage working",
+            "   Stored and retrieved key successfully",
+        ]))
     except Exception as e:
-        print(f"❌ Storage failed: {e}")
-        results.append(False)
-    
+        results.append((3, False, [f"❌ Storage failed: {e}"]))
+
     # Test 4: FRED API key
-    print("\n[4/8] Checking FRED API key...")
     try:
-        expected_fred_key = "b077ecbf05fa5f0a6407b38e22552c4e"
-        
         # Try to retrieve existing key
         fred_key = creds.get_api_key('fred')
-        
-        if fred_key == expected_fred_key:
-            print("✅ FRED API key is configured correctly")
-            print(f"   Key preview: {fred_key[:10]}...{fred_key[-10:]}")
-            results.append(True)
-        elif fred_key is None:
-            print("⚠️  FRED API key not configured yet")
-            print("   Run: python quickstart_api_keys.py")
-            results.append(False)
-        else:
-            print("⚠️  FRED API key found but doesn't match expected value")
-            print(f"   Current: {fred_key[:10]}...{fred_key[-10:]}")
-            print(f"   Expected: {expected_fred_key[:10]}...{expected_fred_key[-10:]}")
-            results.append(False)
-    except Exception as e:
-        print(f"❌ FRED key check failed: {e}")
-        results.append(False)
-    
-    # Test 5: Data loader integration
-    print("\n[5/8] Testing data loader integration...")
-    try:
-        from modules.data_loader import load_fred_data, get_latest_value
-        print("✅ Data loader imports successfully")
-        print("   Functions: load_fred_data, get_latest_value")
-        results.append(True)
-    except Exception as e:
-        print(f"❌ Data loader integration failed: {e}")
-        results.append(False)
-    
-    # Test 6: File structure
-    print("\n[6/8] Verifying file structure...")
-    try:
-        required_files = [
-            'modules/auth/__init__.py',
-            'modules/auth/credentials_manager.py',
-            'pages/3_API_Key_Management.py',
-            'tests/test_credentials_manager.py',
-            'setup_credentials.py',
-            'quickstart_api_keys.py',
-            'FEATURE_API_KEY_MANAGEMENT.md',
-            'IMPLEMENTATION_SUMMARY.md'
-        ]
-        
-        all_exist = True
-        for file in required_files:
-            if os.path.exists(file):
-                print(f"   ✓ {file}")
-            else:
-                print(f"   ✗ {file} (missing)")
-                all_exist = False
-        
-        if all_exist:
-            print("✅ All required files present")
-            results.append(True)
+        env_key = os.environ.get('FRED_API_KEY')
+
+        if not fred_key:
+            results.append((4, False, [
+                "⚠️  FRED API key not configured yet",
+                "   Run: python scripts/quickstart_api_keys.py",
+            ]))
+        elif env_key and fred_key != env_key:
+            results.append((4, False, ["⚠️  Stored FRED API key doesn't match FRED_API_KEY"]))
         else:
-            print("❌ Some files are missing")
-            results.append(False)
+            results.append((4, True, ["✅ FRED API key is configured"]))
     except Exception as e:
-        print(f"❌ File structure check failed: {e}")
-        results.append(False)
-    
+        results.append((4, False, [f"❌ FRED key check failed: {e}"]))
+
     # Test 7: Encryption verification
-    print("\n[7/8] Testing encryption...")
     try:
         # Store a test key
         original_key = "encryption_test_secret_123"
         creds.set_api_key('encryption_test', original_key)
-        
-        # Read the encrypted file
+
+        # Scan the encrypted file in place rather than reading it into memory
         if creds.creds_file.exists():
-            with open(creds.creds_file, 'rb') as f:
-                encrypted_data = f.read()
-            
+            with open(creds.creds_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as encrypted_data:
+                plaintext_found = encrypted_data.find(original_key.encode()) != -1
+
             # Verify it's actually encrypted (should not contain plaintext)
-            if original_key.encode() not in encrypted_data:
-                print("✅ Encryption verified")
-                print("   Keys are encrypted in storage")
-                results.append(True)
+            if not plaintext_found:
+                results.append((7, True, [
+                    "✅ Encryption verified",
+                    "   Keys are encrypted in storage",
+                ]))
             else:
-                print("❌ Keys appear to be stored in plaintext!")
-                results.append(False)
+                results.append((7, False, ["❌ Keys appear to be stored in plaintext!"]))
         else:
-            print("⚠️  No credentials file found")
-            results.append(False)
-        
+            results.append((7, False, ["⚠️  No credentials file found"]))
+
         # Clean up
         creds.delete_api_key('encryption_test')
         creds.delete_api_key('test_service')
     except Exception as e:
-        print(f"❌ Encryption verification failed: {e}")
-        results.append(False)
-    
-    # Test 8: Configuration
-    print("\n[8/8] Checking configuration...")
+        results.append((7, False, [f"❌ Encryption verification failed: {e}"]))
+
+    return results
+
+
+def check_data_loader():
+    """Test 5: Data loader integration"""
+    try:
+        from modules.data_loader import load_fred_data, get_latest_value
+        return [(5, True, [
+            "✅ Data loader imports successfully",
+            "   Functions: load_fred_data, get_latest_value",
+        ])]
+    except Exception as e:
+        return [(5, False, [f"❌ Data loader integration failed: {e}"])]
+
+
+def check_file_structure():
+    """Test 6: File structure"""
+    try:
+        required_files = [
+            'modules/auth/__init__.py',
+            'modules/auth/credentials_manager.py',
+            'modules/auth/setup.py',
+            'pages/6_API_Key_Management.py',
+            'tests/test_credentials_manager.py',
+            'scripts/setup_credentials.py',
+            'scripts/quickstart_api_keys.py',
+            'docs/FEATURE_API_KEY_MANAGEMENT.md',
+            'docs/IMPLEMENTATION_SUMMARY.md'
+        ]
+
+        # List each parent directory once instead of stat-ing every file
+        existing = set()
+        for directory in {os.path.dirname(file) for file in required_files}:
+            try:
+                with os.scandir(os.path.join(PROJECT_ROOT, directory)) as entries:
+                    existing.update(os.path.join(directory, entry.name)
+                                    for entry in entries if entry.is_file())
+            except FileNotFoundError:
+                continue
+        missing = set(required_files) - existing
+
+        lines = [f"   ✗ {file} (missing)" if file in missing else f"   ✓ {file}"
+                 for file in required_files]
+        all_exist = not missing
+
+        if all_exist:
+            lines.append("✅ All required files present")
+        else:
+            lines.append("❌ Some files are missing")
+        return [(6, all_exist, lines)]
+    except Exception as e:
+        return [(6, False, [f"❌ File structure check failed: {e}"])]
+
+
+def check_configuration():
+    """Test 8: Configuration"""
     try:
+        lines = []
+
         # Check requirements.txt
-        with open('requirements.txt', 'r') as f:
+        with open(os.path.join(PROJECT_ROOT, 'requirements.txt'), 'r') as f:
             reqs = f.read()
             if 'cryptography' in reqs:
-                print("✅ cryptography dependency in requirements.txt")
+                lines.append("✅ cryptography dependency in requirements.txt")
             else:
-                print("❌ cryptography missing from requirements.txt")
-                results.append(False)
-                return results
-        
+                lines.append("❌ cryptography missing from requirements.txt")
+                return [(8, False, lines)]
+
         # Check .gitignore
-        with open('.gitignore', 'r') as f:
+        with open(os.path.join(PROJECT_ROOT, '.gitignore'), 'r') as f:
             gitignore = f.read()
             if 'data/credentials/' in gitignore:
-                print("✅ credentials directory in .gitignore")
+                lines.append("✅ credentials directory in .gitignore")
             else:
-                print("❌ credentials directory not in .gitignore")
-                results.append(False)
-                return results
-        
-        results.append(True)
+                lines.append("❌ credentials directory not in .gitignore")
+                return [(8, False, lines)]
+
+        return [(8, True, lines)]
     except Exception as e:
-        print(f"❌ Configuration check failed: {e}")
-        results.append(False)
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print("📊 VERIFICATION SUMMARY")
-    print("=" * 70)
-    
-    total_tests = len(results)
-    passed_tests = sum(results)
-    failed_tests = total_tests - passed_tests
-    
-    print(f"\nTotal Tests: {total_tests}")
-    print(f"Passed: {passed_tests} ✅")
-    print(f"Failed: {failed_tests} ❌")
-    print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
-    
-    if all(results):
-        print("\n🎉 ALL TESTS PASSED!")
-        print("\n✅ The API Key Management feature is fully functional")
-        print("\n📋 Next steps:")
-        print("   1. Run: python quickstart_api_keys.py (if FRED key not configured)")
-        print("   2. Run: streamlit run app.py")
-        print("   3. Check the 'API Key Management' page")
-        print("   4. Verify FRED API status in sidebar")
-        return 0
-    else:
-        print("\n⚠️  SOME TESTS FAILED")
-        print("\n🔧 Troubleshooting:")
-        print("   1. Ensure all dependencies installed: pip install -r requirements.txt")
-        print("   2. Run setup: python quickstart_api_keys.py")
-        print("   3. Check file permissions on data/credentials/")
-        print("   4. Review error messages above")
-        return 1
+        return [(8, False, [f"❌ Configuration check failed: {e}"])]
+
+
+def verify_implementation():
+    """Verify all components of the API key management feature"""
+
+    # Collect the report and write it in one go instead of per line
+    buf = io.StringIO()
+    try:
+        print("=" * 70, file=buf)
+        print("🔍 API KEY MANAGEMENT FEATURE VERIFICATION", file=buf)
+        print("=" * 70, file=buf)
+
+        # Independent checks run concurrently; the credentials checks share one task
+        checks = [check_imports, check_credentials, check_data_loader,
+                  check_file_structure, check_configuration]
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            outcomes = [outcome for check_outcomes in executor.map(lambda check: check(), checks)
+                        for outcome in check_outcomes]
+
+        # Report in check order
+        results = []
+        for idx, ok, lines in sorted(outcomes, key=lambda outcome: outcome[0]):
+            print(f"\n[{idx}/{len(CHECK_TITLES)}] {CHECK_TITLES[idx]}", file=buf)
+            for line in lines:
+                print(line, file=buf)
+            results.append(ok)
+
+        # Summary
+        print("\n" + "=" * 70, file=buf)
+        print("📊 VERIFICATION SUMMARY", file=buf)
+        print("=" * 70, file=buf)
+
+        total_tests = len(results)
+        passed_tests = sum(results)
+        failed_tests = total_tests - passed_tests
+
+        print(f"\nTotal Tests: {total_tests}", file=buf)
+        print(f"Passed: {passed_tests} ✅", file=buf)
+        print(f"Failed: {failed_tests} ❌", file=buf)
+        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%", file=buf)
+
+        if all(results):
+            print("\n🎉 ALL TESTS PASSED!", file=buf)
+            print("\n✅ The API Key Management feature is fully functional", file=buf)
+            print("\n📋 Next steps:", file=buf)
+            print("   1. Run: python scripts/quickstart_api_keys.py (if FRED key not configured)", file=buf)
+            print("   2. Run: streamlit run app.py", file=buf)
+            print("   3. Check the 'API Key Management' page", file=buf)
+            print("   4. Verify FRED API status in sidebar", file=buf)
+            return 0
+        else:
+            print("\n⚠️  SOME TESTS FAILED", file=buf)
+            print("\n🔧 Troubleshooting:", file=buf)
+            print("   1. Ensure all dependencies installed: pip install -r requirements.txt", file=buf)
+            print("   2. Run setup: python scripts/quickstart_api_keys.py", file=buf)
+            print("   3. Check file permissions on data/credentials/", file=buf)
+            print("   4. Review error messages above", file=buf)
+            return 1
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,20 @@ import os
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Tests run against a transient in-memory DuckDB rather than the persisted
+# file; this also gives each pytest-xdist worker its own database
+os.environ.setdefault('ECONOMIC_DASHBOARD_DB_PATH', ':memory:')
+
+
+@pytest.fixture(scope="session", autouse=True)
+def duckdb_schema():
+    """Create the database schema once per test session."""
+    try:
+        from modules.database import init_database
+    except ImportError:
+        return
+    init_database()
+
 
 @pytest.fixture
 def sample_fred_series():
@@ -4,23 +4,35 @@ Unit tests for credentials manager.
 
 import pytest
 import os
-import tempfile
+import shutil
 from pathlib import Path
-from modules.auth.credentials_manager import CredentialsManager
+from modules.auth.credentials_manager import CredentialsManager, NullCipher
+
+
+@pytest.fixture(scope="session")
+def _template_key_file(tmp_path_factory):
+    """Generate one encryption key for the whole session."""
+    template_dir = tmp_path_factory.mktemp("creds_template")
+    return CredentialsManager(credentials_dir=str(template_dir)).key_file
 
 
 class TestCredentialsManager:
     """Test cases for credentials manager."""
 
     @pytest.fixture
-    def temp_creds_dir(self):
-        """Create temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
+    def temp_creds_dir(self, tmp_path, _template_key_file):
+        """Create temporary directory seeded with the pre-generated key."""
+        shutil.copy(_template_key_file, tmp_path / _template_key_file.name)
+        return str(tmp_path)
 
     @pytest.fixture
     def creds_manager(self, temp_creds_dir):
-        """Create credentials manager with temp directory."""
+        """Create credentials manager with temp directory, skipping encryption."""
+        return CredentialsManager(credentials_dir=temp_creds_dir, cipher=NullCipher())
+
+    @pytest.fixture
+    def creds_manager_encrypted(self, temp_creds_dir):
+        """Create credentials manager that encrypts with the real Fernet cipher."""
         return CredentialsManager(credentials_dir=temp_creds_dir)
 
     def test_initialization(self, creds_manager, temp_creds_dir):
@@ -44,8 +56,7 @@ class TestCredentialsManager:
             'worldbank': 'wb_key_789'
         }
         
-        for service, key in keys.items():
-            creds_manager.set_api_key(service, key)
+        creds_manager.set_api_keys(keys)
         
         for service, key in keys.items():
             assert creds_manager.get_api_key(service) == key
@@ -68,8 +79,7 @@ class TestCredentialsManager:
         """Test listing configured services."""
         services = ['fred', 'yahoo', 'alpha_vantage']
         
-        for service in services:
-            creds_manager.set_api_key(service, f'{service}_key')
+        creds_manager.set_api_keys({service: f'{service}_key' for service in services})
         
         listed = creds_manager.list_services()
         assert set(listed) == set(services)
@@ -93,6 +103,13 @@ class TestCredentialsManager:
         
         assert retrieved_key == 'secret_key_123'
 
+    def test_stored_file_is_encrypted(self, creds_manager_encrypted):
+        """Test that keys are not written to disk in plaintext."""
+        creds_manager_encrypted.set_api_key('fred', 'plaintext_secret_456')
+        
+        assert b'plaintext_secret_456' not in creds_manager_encrypted.creds_file.read_bytes()
+        assert creds_manager_encrypted.get_api_key('fred') == 'plaintext_secret_456'
+
     def test_empty_credentials(self, creds_manager):
         """Test behavior with no stored credentials."""
         assert creds_manager.list_services() == []
@@ -3,6 +3,7 @@ Unit tests for data_loader module.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 import streamlit as st
 from unittest.mock import patch, MagicMock
@@ -23,19 +24,29 @@ def clear_streamlit_cache():
     st.cache_data.clear()
 
 
+@pytest.fixture(scope="module")
+def fred_mock_df(request):
+    """
+    Three observations shaped like a pdr.DataReader result.
+    
+    The series ID defaults to CPIAUCSL; parametrize indirectly to use another.
+    """
+    series_id = getattr(request, 'param', 'CPIAUCSL')
+    return pd.DataFrame(
+        {series_id: np.arange(100.0, 103.0)},
+        index=pd.date_range('2020-01-01', periods=3)
+    )
+
+
 class TestDataLoader:
     """Test cases for data loading functions."""
 
+    @pytest.mark.parametrize('fred_mock_df', ['A191RL1Q225SBEA'], indirect=True)
     @patch('modules.data_loader._load_cached_data', return_value=None)
     @patch('modules.data_loader.pdr.DataReader')
-    def test_load_fred_data_success(self, mock_datareader, mock_cache):
+    def test_load_fred_data_success(self, mock_datareader, mock_cache, fred_mock_df):
         """Test successful FRED data loading."""
-        # Mock data
-        mock_df = pd.DataFrame({
-            'A191RL1Q225SBEA': [1.0, 2.0, 3.0]
-        }, index=pd.date_range('2020-01-01', periods=3))
-
-        mock_datareader.return_value = mock_df
+        mock_datareader.return_value = fred_mock_df
 
         series_ids = {'GDP Growth': 'A191RL1Q225SBEA'}
         result = load_fred_data(series_ids)
@@ -85,13 +96,9 @@ class TestDataLoader:
 
     @patch('modules.data_loader._load_cached_data', return_value=None)
     @patch('modules.data_loader.pdr.DataReader')
-    def test_get_latest_value_success(self, mock_datareader, mock_cache):
+    def test_get_latest_value_success(self, mock_datareader, mock_cache, fred_mock_df):
         """Test getting latest value successfully."""
-        mock_df = pd.DataFrame({
-            'CPIAUCSL': [100.0, 101.0, 102.0]
-        }, index=pd.date_range('2020-01-01', periods=3))
-
-        mock_datareader.return_value = mock_df
+        mock_datareader.return_value = fred_mock_df
 
         result = get_latest_value('CPIAUCSL')
 
@@ -0,0 +1,104 @@
+"""
+Unit tests for DatabaseConnection transactions and bulk writes.
+"""
+
+import pytest
+import pandas as pd
+from modules.database import get_db_connection
+
+
+@pytest.fixture
+def db():
+    """The shared in-memory connection with a scratch keyed table."""
+    db = get_db_connection()
+    db.execute("""
+        CREATE TABLE test_quotes (
+            ticker VARCHAR NOT NULL,
+            date DATE NOT NULL,
+            close DOUBLE,
+            PRIMARY KEY (ticker, date)
+        )
+    """)
+    yield db
+    db.execute("DROP TABLE IF EXISTS test_quotes")
+
+
+def _count(conn, table_name: str = 'test_quotes') -> int:
+    return conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+
+class TestTransaction:
+    """Test cases for DatabaseConnection.transaction()."""
+
+    def test_commits_once_on_exit(self, db):
+        """Writes inside the block stay uncommitted until it exits."""
+        other = db.connection.cursor()
+        try:
+            with db.transaction():
+                db.execute("INSERT INTO test_quotes VALUES ('SPY', '2024-01-02', 470.0)")
+                db.execute("INSERT INTO test_quotes VALUES ('SPY', '2024-01-03', 468.0)")
+                # execute() must not commit while the transaction is open
+                assert _count(other) == 0
+
+            assert _count(other) == 2
+        finally:
+            other.close()
+
+    def test_rolls_back_on_exception(self, db):
+        """An exception inside the block discards all of its writes."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.execute("INSERT INTO test_quotes VALUES ('SPY', '2024-01-02', 470.0)")
+                raise RuntimeError("boom")
+
+        assert _count(db.connection) == 0
+        assert not db._in_transaction
+
+    def test_execute_commits_again_after_block(self, db):
+        """execute() goes back to committing each statement after the block."""
+        with db.transaction():
+            db.execute("INSERT INTO test_quotes VALUES ('SPY', '2024-01-02', 470.0)")
+
+        db.execute("INSERT INTO test_quotes VALUES ('SPY', '2024-01-03', 468.0)")
+
+        other = db.connection.cursor()
+        try:
+            assert _count(other) == 2
+        finally:
+            other.close()
+
+
+class TestUpsertDf:
+    """Test cases for DatabaseConnection.upsert_df()."""
+
+    @pytest.mark.parametrize('key_columns', [None, ['ticker', 'date']])
+    def test_overwrites_existing_keys(self, db, key_columns):
+        """Rows with an existing primary key replace it; new keys are inserted."""
+        db.execute("INSERT INTO test_quotes VALUES ('SPY', '2024-01-02', 470.0)")
+
+        df = pd.DataFrame({
+            'ticker': ['SPY', 'QQQ'],
+            'date': pd.to_datetime(['2024-01-02', '2024-01-02']),
+            'close': [471.5, 402.0],
+        })
+        db.upsert_df(df, 'test_quotes', key_columns=key_columns)
+
+        result = db.query("SELECT ticker, close FROM test_quotes ORDER BY ticker")
+        assert result['ticker'].tolist() == ['QQQ', 'SPY']
+        assert result['close'].tolist() == [402.0, 471.5]
+
+    def test_upsert_inside_transaction_rolls_back(self, db):
+        """upsert_df() writes are part of an enclosing transaction."""
+        db.execute("INSERT INTO test_quotes VALUES ('SPY', '2024-01-02', 470.0)")
+
+        df = pd.DataFrame({
+            'ticker': ['SPY'],
+            'date': pd.to_datetime(['2024-01-02']),
+            'close': [471.5],
+        })
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.upsert_df(df, 'test_quotes')
+                raise RuntimeError("boom")
+
+        assert db.query("SELECT close FROM test_quotes")['close'].tolist() == [470.0]
@@ -44,9 +44,8 @@ try:
     
     # Verify tables exist
     tables_query = """
-        SELECT name FROM sqlite_master 
-        WHERE type='table' 
-        AND name IN ('leverage_metrics', 'vix_term_structure', 'leveraged_etf_data', 'margin_call_risk')
+        SELECT table_name FROM duckdb_tables()
+        WHERE table_name IN ('leverage_metrics', 'vix_term_structure', 'leveraged_etf_data', 'margin_call_risk')
     """
     result = db.execute(tables_query)
     tables = result.df() if hasattr(result, 'df') else []
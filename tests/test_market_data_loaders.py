@@ -4,9 +4,14 @@ Unit tests for ICI ETF flows and CBOE VIX data loaders.
 
 import pytest
 import pandas as pd
+import requests
 from unittest.mock import patch, MagicMock
 from datetime import datetime
 
+from modules.ici_etf_data import fetch_ici_weekly_etf_flows, fetch_ici_monthly_etf_flows
+from modules.cboe_vix_data import fetch_cboe_vix_history
+from modules.database import schema, queries
+
 
 class TestICIETFDataLoader:
     """Test cases for ICI ETF data loading functions."""
@@ -24,8 +29,6 @@ class TestICIETFDataLoader:
 """
         mock_get.return_value = mock_response
         
-        from modules.ici_etf_data import fetch_ici_weekly_etf_flows
-        
         result = fetch_ici_weekly_etf_flows()
         
         assert not result.empty
@@ -36,11 +39,8 @@ class TestICIETFDataLoader:
     @patch('modules.ici_etf_data.requests.get')
     def test_fetch_ici_weekly_etf_flows_network_error(self, mock_get):
         """Test handling of network errors."""
-        import requests
         mock_get.side_effect = requests.exceptions.RequestException("Network error")
         
-        from modules.ici_etf_data import fetch_ici_weekly_etf_flows
-        
         result = fetch_ici_weekly_etf_flows()
         
         assert result.empty
@@ -56,8 +56,6 @@ class TestICIETFDataLoader:
 """
         mock_get.return_value = mock_response
         
-        from modules.ici_etf_data import fetch_ici_monthly_etf_flows
-        
         result = fetch_ici_monthly_etf_flows()
         
         assert not result.empty
@@ -93,8 +91,6 @@ class TestCBOEVIXDataLoader:
 """
         mock_get.return_value = mock_response
         
-        from modules.cboe_vix_data import fetch_cboe_vix_history
-        
         result = fetch_cboe_vix_history()
         
         assert not result.empty
@@ -105,11 +101,8 @@ class TestCBOEVIXDataLoader:
     @patch('modules.cboe_vix_data.requests.get')
     def test_fetch_cboe_vix_history_network_error(self, mock_get):
         """Test handling of network errors."""
-        import requests
         mock_get.side_effect = requests.exceptions.RequestException("Network error")
         
-        from modules.cboe_vix_data import fetch_cboe_vix_history
-        
         result = fetch_cboe_vix_history()
         
         assert result.empty
@@ -124,8 +117,6 @@ class TestCBOEVIXDataLoader:
 """
         mock_get.return_value = mock_response
         
-        from modules.cboe_vix_data import fetch_cboe_vix_history
-        
         result = fetch_cboe_vix_history()
         
         if not result.empty:
@@ -148,84 +139,37 @@ class TestCBOEVIXDataLoader:
 class TestDatabaseSchema:
     """Test cases for new database schema tables."""
 
-    def test_ici_etf_flows_table_creation(self):
-        """Test ICI ETF flows table can be created."""
-        from modules.database.schema import create_ici_etf_flows_table
-        
+    @pytest.mark.parametrize("create_fn_name", [
+        'create_ici_etf_flows_table',
+        'create_ici_etf_weekly_flows_table',
+        'create_cboe_vix_history_table',
+        'create_cboe_vix_term_structure_table',
+    ])
+    def test_table_creation(self, create_fn_name):
+        """Test each new table can be created."""
         # Should not raise any errors
         try:
-            create_ici_etf_flows_table()
+            getattr(schema, create_fn_name)()
         except Exception as e:
-            pytest.fail(f"Failed to create ici_etf_flows table: {e}")
-
-    def test_ici_etf_weekly_flows_table_creation(self):
-        """Test ICI weekly ETF flows table can be created."""
-        from modules.database.schema import create_ici_etf_weekly_flows_table
-        
-        try:
-            create_ici_etf_weekly_flows_table()
-        except Exception as e:
-            pytest.fail(f"Failed to create ici_etf_weekly_flows table: {e}")
-
-    def test_cboe_vix_history_table_creation(self):
-        """Test CBOE VIX history table can be created."""
-        from modules.database.schema import create_cboe_vix_history_table
-        
-        try:
-            create_cboe_vix_history_table()
-        except Exception as e:
-            pytest.fail(f"Failed to create cboe_vix_history table: {e}")
-
-    def test_cboe_vix_term_structure_table_creation(self):
-        """Test CBOE VIX term structure table can be created."""
-        from modules.database.schema import create_cboe_vix_term_structure_table
-        
-        try:
-            create_cboe_vix_term_structure_table()
-        except Exception as e:
-            pytest.fail(f"Failed to create cboe_vix_term_structure table: {e}")
+            pytest.fail(f"{create_fn_name} failed: {e}")
 
 
 class TestDatabaseQueries:
     """Test cases for new database query functions."""
 
-    def test_get_ici_weekly_etf_flows_function_exists(self):
-        """Test that get_ici_weekly_etf_flows function exists."""
-        from modules.database.queries import get_ici_weekly_etf_flows
-        
-        assert callable(get_ici_weekly_etf_flows)
-
-    def test_get_ici_monthly_etf_flows_function_exists(self):
-        """Test that get_ici_monthly_etf_flows function exists."""
-        from modules.database.queries import get_ici_monthly_etf_flows
-        
-        assert callable(get_ici_monthly_etf_flows)
-
-    def test_get_cboe_vix_history_function_exists(self):
-        """Test that get_cboe_vix_history function exists."""
-        from modules.database.queries import get_cboe_vix_history
-        
-        assert callable(get_cboe_vix_history)
-
-    def test_get_latest_vix_data_function_exists(self):
-        """Test that get_latest_vix_data function exists."""
-        from modules.database.queries import get_latest_vix_data
-        
-        assert callable(get_latest_vix_data)
-
-    def test_insert_functions_exist(self):
-        """Test that insert functions exist for new tables."""
-        from modules.database.queries import (
-            insert_ici_weekly_flows,
-            insert_ici_monthly_flows,
-            insert_cboe_vix_data,
-            insert_cboe_vix_term_structure
-        )
-        
-        assert callable(insert_ici_weekly_flows)
-        assert callable(insert_ici_monthly_flows)
-        assert callable(insert_cboe_vix_data)
-        assert callable(insert_cboe_vix_term_structure)
+    @pytest.mark.parametrize("query_fn_name", [
+        'get_ici_weekly_etf_flows',
+        'get_ici_monthly_etf_flows',
+        'get_cboe_vix_history',
+        'get_latest_vix_data',
+        'insert_ici_weekly_flows',
+        'insert_ici_monthly_flows',
+        'insert_cboe_vix_data',
+        'insert_cboe_vix_term_structure',
+    ])
+    def test_query_function_exists(self, query_fn_name):
+        """Test that each new query/insert function exists."""
+        assert callable(getattr(queries, query_fn_name))
 
 
 class TestDataIntegrity:
@@ -14,6 +14,15 @@ from modules.ml.recession_model import (
 )
 
 
+N_MONTHS = 24
+
+
+@pytest.fixture(scope="module")
+def monthly_dates():
+    """Month-end index shared by the constant-indicator scenarios."""
+    return pd.date_range(end=datetime.now(), periods=N_MONTHS, freq='ME')
+
+
 class TestRecessionProbabilityModel:
     """Test cases for RecessionProbabilityModel class."""
     
@@ -128,21 +137,19 @@ class TestRecessionProbabilityModel:
         total_weight = sum(INDICATOR_WEIGHTS.values())
         assert total_weight == 1.0, f"Weights sum to {total_weight}, expected 1.0"
     
-    def test_yield_curve_inversion_increases_signal(self, model):
+    def test_yield_curve_inversion_increases_signal(self, model, monthly_dates):
         """Test that yield curve inversion increases the yield curve signal."""
-        dates = pd.date_range(end=datetime.now(), periods=24, freq='ME')
-        
         # Normal yield curve (positive spread)
         normal_data = pd.DataFrame({
-            'yield_spread_10y2y': [1.5] * 24,
-            'yield_spread_10y3m': [2.0] * 24,
-        }, index=dates)
+            'yield_spread_10y2y': np.full(N_MONTHS, 1.5),
+            'yield_spread_10y3m': np.full(N_MONTHS, 2.0),
+        }, index=monthly_dates)
         
         # Inverted yield curve (negative spread)
         inverted_data = pd.DataFrame({
-            'yield_spread_10y2y': [-0.5] * 24,
-            'yield_spread_10y3m': [-0.3] * 24,
-        }, index=dates)
+            'yield_spread_10y2y': np.full(N_MONTHS, -0.5),
+            'yield_spread_10y3m': np.full(N_MONTHS, -0.3),
+        }, index=monthly_dates)
         
         # Calculate with normal curve
         model.load_indicators_from_data(normal_data)
@@ -157,22 +164,19 @@ class TestRecessionProbabilityModel:
         # Inverted curve should produce higher signal
         assert inverted_signal > normal_signal
     
-    def test_high_unemployment_increases_labor_signal(self, model):
+    def test_high_unemployment_increases_labor_signal(self, model, monthly_dates):
         """Test that high/rising unemployment increases the labor signal."""
-        dates = pd.date_range(end=datetime.now(), periods=24, freq='ME')
-        
         # Low, stable unemployment
         low_unemp_data = pd.DataFrame({
-            'unemployment_rate': [3.5] * 24,
-            'initial_claims': [200000] * 24,
-        }, index=dates)
+            'unemployment_rate': np.full(N_MONTHS, 3.5),
+            'initial_claims': np.full(N_MONTHS, 200000.0),
+        }, index=monthly_dates)
         
         # High, rising unemployment (simulating Sahm rule trigger)
-        high_unemp_values = list(np.linspace(3.5, 4.5, 24))  # Rising unemployment
         high_unemp_data = pd.DataFrame({
-            'unemployment_rate': high_unemp_values,
-            'initial_claims': [350000] * 24,
-        }, index=dates)
+            'unemployment_rate': np.linspace(3.5, 4.5, N_MONTHS),  # Rising unemployment
+            'initial_claims': np.full(N_MONTHS, 350000.0),
+        }, index=monthly_dates)
         
         # Calculate with low unemployment
         model.load_indicators_from_data(low_unemp_data)
@@ -205,18 +209,16 @@ class TestRecessionProbabilityModel:
             assert key in explanations
             assert len(explanations[key]) > 0  # Should have non-empty explanation
     
-    def test_risk_level_thresholds(self, model):
+    def test_risk_level_thresholds(self, model, monthly_dates):
         """Test that risk levels are assigned correctly based on probability."""
-        dates = pd.date_range(end=datetime.now(), periods=24, freq='ME')
-        
         # Create data that should produce LOW risk (minimal indicators)
         low_risk_data = pd.DataFrame({
-            'yield_spread_10y2y': [2.0] * 24,
-            'unemployment_rate': [3.5] * 24,
-            'consumer_sentiment': [100] * 24,
-            'real_gdp_growth': [3.0] * 24,
-            'building_permits': [1500] * 24,
-        }, index=dates)
+            'yield_spread_10y2y': np.full(N_MONTHS, 2.0),
+            'unemployment_rate': np.full(N_MONTHS, 3.5),
+            'consumer_sentiment': np.full(N_MONTHS, 100.0),
+            'real_gdp_growth': np.full(N_MONTHS, 3.0),
+            'building_permits': np.full(N_MONTHS, 1500.0),
+        }, index=monthly_dates)
         
         model.load_indicators_from_data(low_risk_data)
         result = model.calculate_recession_probability()
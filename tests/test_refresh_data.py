@@ -0,0 +1,184 @@
+"""
+Unit tests for the FRED fetching and refresh logic in scripts/refresh_data.py.
+"""
+
+import pytest
+import pandas as pd
+import requests
+from unittest.mock import patch, MagicMock
+from scripts import refresh_data
+
+
+SECRET_KEY = 'SECRETKEY1234567890'
+
+
+def _error_response(status_code: int, url: str) -> requests.Response:
+    """Build a failed response whose raise_for_status() echoes the URL."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'Bad Request'
+    response.url = url
+    return response
+
+
+class TestFredErrorReporting:
+    """The API key travels in the query string and must never be printed."""
+
+    @patch('scripts.refresh_data.get_fred_api_key', return_value=SECRET_KEY)
+    @patch('scripts.refresh_data.get_fred_session')
+    def test_http_error_does_not_print_api_key(self, mock_session, mock_key, capsys):
+        """HTTP errors are reported by status code, not by URL."""
+        url = f"{refresh_data.FRED_API_URL}/series/observations?series_id=GDP&api_key={SECRET_KEY}"
+        mock_session.return_value.get.return_value = _error_response(400, url)
+
+        with pytest.raises(ValueError):
+            refresh_data.fetch_fred_data({'GDP': 'GDP'})
+
+        out = capsys.readouterr().out
+        assert SECRET_KEY not in out
+        assert 'GDP' in out
+        assert 'HTTP 400' in out
+
+    @patch('scripts.refresh_data.get_fred_api_key', return_value=SECRET_KEY)
+    @patch('scripts.refresh_data.get_fred_session')
+    def test_connection_error_does_not_print_api_key(self, mock_session, mock_key, capsys):
+        """Other request errors have the key masked out of their message."""
+        mock_session.return_value.get.side_effect = requests.ConnectionError(
+            f"Max retries exceeded with url: /fred/series/observations?series_id=GDP&api_key={SECRET_KEY}&file_type=json"
+        )
+
+        with pytest.raises(ValueError):
+            refresh_data.fetch_fred_data({'GDP': 'GDP'})
+
+        out = capsys.readouterr().out
+        assert SECRET_KEY not in out
+        assert 'api_key=***' in out
+
+
+def _fake_fred_session(last_updated: dict, observations: dict, failing: tuple = ()):
+    """
+    Build a mock session that answers the FRED series and observations endpoints.
+    
+    Args:
+        last_updated: series_id -> 'last_updated' stamp served by /series
+        observations: series_id -> list of (date, value) served by /series/observations
+        failing: series IDs whose /series lookup returns HTTP 500
+    """
+    def get(url, params=None, timeout=None):
+        series_id = params['series_id']
+        if url.endswith('/series/observations'):
+            response = MagicMock()
+            response.json.return_value = {'observations': [
+                {'date': date, 'value': value} for date, value in observations[series_id]
+            ]}
+            return response
+        if series_id in failing:
+            return _error_response(500, f"{url}?series_id={series_id}&api_key={SECRET_KEY}")
+        response = MagicMock()
+        response.json.return_value = {'seriess': [{'last_updated': last_updated[series_id]}]}
+        return response
+
+    session = MagicMock()
+    session.get.side_effect = get
+    return session
+
+
+def _observation_calls(session) -> list:
+    """Series IDs requested from the observations endpoint."""
+    return [call.kwargs['params']['series_id'] for call in session.get.call_args_list
+            if call.args[0].endswith('/series/observations')]
+
+
+@pytest.fixture
+def previous_cache():
+    """A cache from an earlier run holding GDP and UNRATE."""
+    return {
+        'data': pd.DataFrame(
+            {'GDP': [1.0, 2.0], 'Unemployment': [4.0, 4.1]},
+            index=pd.to_datetime(['2024-01-01', '2024-04-01'])
+        ),
+        'series_last_updated': {'GDP': 'stamp-1', 'UNRATE': 'stamp-1'},
+    }
+
+
+SERIES = {'GDP': 'GDP', 'Unemployment': 'UNRATE'}
+NEW_OBSERVATIONS = {
+    'GDP': [('2024-01-01', '1.0'), ('2024-04-01', '2.0'), ('2024-07-01', '3.0')],
+    'UNRATE': [('2024-01-01', '4.0'), ('2024-04-01', '4.1'), ('2024-07-01', '4.2')],
+}
+
+
+@patch('scripts.refresh_data.get_fred_api_key', return_value=SECRET_KEY)
+class TestRefreshFredData:
+    """Test cases for the reuse-versus-refetch decision in refresh_fred_data()."""
+
+    def test_unchanged_series_are_reused(self, mock_key, previous_cache):
+        """Series whose stamp matches the cache are not fetched again."""
+        session = _fake_fred_session({'GDP': 'stamp-1', 'UNRATE': 'stamp-1'}, NEW_OBSERVATIONS)
+        with patch('scripts.refresh_data.get_fred_session', return_value=session):
+            data, last_updated = refresh_data.refresh_fred_data(SERIES, previous_cache)
+
+        assert _observation_calls(session) == []
+        pd.testing.assert_frame_equal(data, previous_cache['data'])
+        assert last_updated == {'GDP': 'stamp-1', 'UNRATE': 'stamp-1'}
+
+    def test_stale_series_are_refetched(self, mock_key, previous_cache):
+        """Only series with a newer stamp are fetched, and their stamp is recorded."""
+        session = _fake_fred_session({'GDP': 'stamp-2', 'UNRATE': 'stamp-1'}, NEW_OBSERVATIONS)
+        with patch('scripts.refresh_data.get_fred_session', return_value=session):
+            data, last_updated = refresh_data.refresh_fred_data(SERIES, previous_cache)
+
+        assert _observation_calls(session) == ['GDP']
+        assert data['GDP'].dropna().tolist() == [1.0, 2.0, 3.0]
+        assert data['Unemployment'].dropna().tolist() == [4.0, 4.1]
+        assert last_updated == {'GDP': 'stamp-2', 'UNRATE': 'stamp-1'}
+
+    def test_failed_metadata_fetch_refetches_series(self, mock_key, previous_cache):
+        """A series whose stamp can't be read is fetched, and no stamp is stored for it."""
+        session = _fake_fred_session({'GDP': 'stamp-1'}, NEW_OBSERVATIONS, failing=('UNRATE',))
+        with patch('scripts.refresh_data.get_fred_session', return_value=session):
+            data, last_updated = refresh_data.refresh_fred_data(SERIES, previous_cache)
+
+        assert _observation_calls(session) == ['UNRATE']
+        assert data['Unemployment'].dropna().tolist() == [4.0, 4.1, 4.2]
+        assert last_updated == {'GDP': 'stamp-1'}
+
+    def test_missing_key_fetches_everything(self, mock_key, previous_cache):
+        """Without an API key every series is fetched and no stamps are kept."""
+        mock_key.return_value = None
+        fetched = pd.DataFrame({'GDP': [1.0], 'Unemployment': [4.0]})
+        with patch('scripts.refresh_data.fetch_fred_data', return_value=fetched) as mock_fetch, \
+                patch('scripts.refresh_data.get_fred_session') as mock_session:
+            data, last_updated = refresh_data.refresh_fred_data(SERIES, previous_cache)
+
+        mock_fetch.assert_called_once_with(SERIES, years_back=20)
+        mock_session.assert_not_called()
+        assert data is fetched
+        assert last_updated == {}
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    @patch('scripts.refresh_data.time.sleep')
+    @patch('scripts.refresh_data.time.monotonic', return_value=100.0)
+    def test_spaces_calls_evenly(self, mock_monotonic, mock_sleep):
+        """Back-to-back calls are pushed one interval apart."""
+        limiter = refresh_data.RateLimiter(calls_per_minute=60)
+
+        for _ in range(3):
+            limiter.wait()
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    @patch('scripts.refresh_data.time.sleep')
+    @patch('scripts.refresh_data.time.monotonic')
+    def test_no_wait_once_interval_has_passed(self, mock_monotonic, mock_sleep):
+        """A call made after the interval has elapsed does not sleep."""
+        mock_monotonic.side_effect = [100.0, 100.0, 101.5]
+        limiter = refresh_data.RateLimiter(calls_per_minute=60)
+
+        limiter.wait()
+        limiter.wait()
+
+        mock_sleep.assert_not_called()